@@ -5,15 +5,28 @@ import logging
 import csv
 import shutil
 import os
-from typing import List, Dict
+from typing import List, Dict, Iterator, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 from .models import ViolationReport, PersistedBarkEvent, Violation
 from ..utils.helpers import convert_numpy_types, get_analysis_logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = get_analysis_logger()
 
 
+def _load_json(f):
+    """Parse JSON from a binary file object, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(f.read())
+    return json.load(f)
+
+
 class ViolationDatabase:
     """Manages collection and persistence of violation reports."""
     
@@ -51,6 +64,10 @@ class ViolationDatabase:
         
         self.violations: List[ViolationReport] = []
         
+        # Parsed events/violations per date, reused while the file's (mtime_ns, size) is unchanged
+        self._event_cache: Dict[str, Tuple[Tuple[int, int], List[PersistedBarkEvent]]] = {}
+        self._violation_cache: Dict[str, Tuple[Tuple[int, int], List[Violation]]] = {}
+        
         if not self.use_date_structure:
             self._load_violations_legacy()
         # Date-based loading happens per-date in get_violations_by_date()
@@ -117,6 +134,7 @@ class ViolationDatabase:
             logger.info(f"🔄 Overwriting existing analysis files for {date}")
 
         events_file = self._get_events_file_path(date)
+        self._event_cache.pop(date, None)
 
         try:
             # Create directory structure
@@ -156,15 +174,60 @@ class ViolationDatabase:
         events = []
         
         try:
-            if events_file.exists():
-                with open(events_file, 'r') as f:
-                    data = json.load(f)
-                    for event_data in data.get('events', []):
-                        events.append(PersistedBarkEvent.from_dict(event_data))
+            stat = events_file.stat()
+        except OSError:
+            self._event_cache.pop(date, None)
+            return events
+        
+        # Reuse the parsed events while the file is unchanged (e.g. analysis and
+        # report conversion both load the same day)
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._event_cache.get(date)
+        if cached is not None and cached[0] == file_key:
+            return list(cached[1])
+        
+        try:
+            with open(events_file, 'rb') as f:
+                data = _load_json(f)
+                for event_data in data.get('events', []):
+                    events.append(PersistedBarkEvent.from_dict(event_data))
         except Exception as e:
             logger.warning(f"Could not load events for date {date}: {e}")
+            return events
+        
+        self._event_cache[date] = (file_key, events)
+        return list(events)
+    
+    def load_events_iter(self, date: str,
+                         hour_range: Optional[Tuple[float, float]] = None) -> Iterator[PersistedBarkEvent]:
+        """Yield events for a specific date, optionally only those within an hour window.
+        
+        Events come from load_events(), so the per-date cache is shared and a
+        file that can't be read yields nothing.
+        
+        Args:
+            date: Date in YYYY-MM-DD format
+            hour_range: Inclusive (start_hour, end_hour) window on realworld_time,
+                e.g. (6, 20) for 6am-8pm; None yields every event
+            
+        Yields:
+            PersistedBarkEvent objects for that date
+        """
+        if not self.use_date_structure:
+            raise ValueError("load_events_iter() only supported in date-based structure mode")
         
-        return events
+        for event in self.load_events(date):
+            if hour_range is not None:
+                try:
+                    # realworld_time is zero-padded HH:MM:SS
+                    t = event.realworld_time
+                    event_hour = int(t[0:2]) + int(t[3:5]) / 60
+                except (TypeError, ValueError) as e:
+                    logger.warning(f"Skipping event {event.bark_id} for date {date} with bad realworld_time: {e}")
+                    continue
+                if not hour_range[0] <= event_hour <= hour_range[1]:
+                    continue
+            yield event
     
     def save_violations_new(self, violations: List[Violation], date: str, overwrite_mode: str = "overwrite"):
         """Save violations to date-partitioned file structure.
@@ -196,6 +259,7 @@ class ViolationDatabase:
             logger.info(f"🔄 Overwriting existing analysis files for {date}")
 
         violations_file = self._get_violations_file_path(date)
+        self._violation_cache.pop(date, None)
 
         try:
             # Create directory structure
@@ -235,22 +299,35 @@ class ViolationDatabase:
         violations = []
         
         try:
-            if violations_file.exists():
-                with open(violations_file, 'r') as f:
-                    data = json.load(f)
-                    for violation_data in data.get('violations', []):
-                        violations.append(Violation.from_dict(violation_data))
+            stat = violations_file.stat()
+        except OSError:
+            self._violation_cache.pop(date, None)
+            return violations
+        
+        # Reuse the parsed violations while the file is unchanged
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._violation_cache.get(date)
+        if cached is not None and cached[0] == file_key:
+            return list(cached[1])
+        
+        try:
+            with open(violations_file, 'rb') as f:
+                data = _load_json(f)
+                for violation_data in data.get('violations', []):
+                    violations.append(Violation.from_dict(violation_data))
         except Exception as e:
             logger.warning(f"Could not load violations for date {date}: {e}")
+            return violations
         
-        return violations
+        self._violation_cache[date] = (file_key, violations)
+        return list(violations)
     
     def _load_violations_legacy(self):
         """Load existing violations from legacy single database file."""
         try:
             if self.db_path.exists():
-                with open(self.db_path, 'r') as f:
-                    data = json.load(f)
+                with open(self.db_path, 'rb') as f:
+                    data = _load_json(f)
                     self.violations = []
                     for violation_data in data.get('violations', []):
                         # Add backward compatibility for records without new timestamp fields
@@ -271,8 +348,8 @@ class ViolationDatabase:
 
         try:
             if violations_file.exists():
-                with open(violations_file, 'r') as f:
-                    data = json.load(f)
+                with open(violations_file, 'rb') as f:
+                    data = _load_json(f)
                     for violation_data in data.get('violations', []):
                         # New-format violations (Violation model persisted as JSON)
                         if 'type' in violation_data and 'startTimestamp' in violation_data:
@@ -346,6 +423,7 @@ class ViolationDatabase:
             return
             
         violations_file = self._get_violations_file_path(date)
+        self._violation_cache.pop(date, None)
         
         try:
             # Create directory structure
@@ -439,6 +517,7 @@ class ViolationDatabase:
         """Remove all violations for a specific date."""
         if self.use_date_structure:
             violations_file = self._get_violations_file_path(date)
+            self._violation_cache.pop(date, None)
             removed_count = 0
             if violations_file.exists():
                 existing_violations = self._load_violations_for_date(date)
@@ -521,6 +600,7 @@ class ViolationDatabase:
 
         events_file = self._get_events_file_path(date)
         existing_events = self.load_events(date)
+        self._event_cache.pop(date, None)
 
         # Merge existing and new events
         all_events = existing_events + new_events
@@ -562,6 +642,7 @@ class ViolationDatabase:
 
         violations_file = self._get_violations_file_path(date)
         existing_violations = self.load_violations_new(date)
+        self._violation_cache.pop(date, None)
 
         # Merge existing and new violations
         all_violations = existing_violations + new_violations
@@ -5,7 +5,7 @@ import uuid
 import librosa
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from .models import ViolationReport, LegalIntermittentSession, PersistedBarkEvent, Violation, AlgorithmInputEvent
 from .database import ViolationDatabase
 from ..core.models import BarkingSession
@@ -142,12 +142,31 @@ class LegalViolationTracker:
 
         return groups
 
-    def _analyze_constant_violations_from_events(self, events: List[AlgorithmInputEvent], gap_threshold: float = None) -> List[Violation]:
+    def _parse_start_times(self, events: List[AlgorithmInputEvent]) -> List[datetime]:
+        """Parse each event's ISO startTimestamp once so the violation scans can share them."""
+        return [datetime.fromisoformat(event.startTimestamp.replace('Z', '+00:00')) for event in events]
+
+    def _analyze_violations_from_events(self, events: List[AlgorithmInputEvent]) -> Tuple[List[Violation], List[Violation]]:
+        """Find constant and intermittent violations, parsing the event timestamps once for both.
+
+        Args:
+            events: List of AlgorithmInputEvent objects sorted by startTimestamp
+
+        Returns:
+            (constant_violations, intermittent_violations)
+        """
+        start_times = self._parse_start_times(events)
+        return (self._analyze_constant_violations_from_events(events, start_times=start_times),
+                self._analyze_intermittent_violations_from_events(events, start_times=start_times))
+
+    def _analyze_constant_violations_from_events(self, events: List[AlgorithmInputEvent], gap_threshold: float = None,
+                                                 start_times: Optional[List[datetime]] = None) -> List[Violation]:
         """Find constant violations using start timestamp intervals per formal algorithm.
 
         Args:
             events: List of AlgorithmInputEvent objects sorted by startTimestamp
             gap_threshold: Maximum gap in seconds between consecutive bark events (uses config if None)
+            start_times: Parsed startTimestamp of each event, from _parse_start_times (parsed here if None)
 
         Returns:
             List of Violation objects for detected constant violations
@@ -161,6 +180,9 @@ class LegalViolationTracker:
         if len(events) < 2:
             return violations
 
+        if start_times is None:
+            start_times = self._parse_start_times(events)
+
         # Track sessions and their violations to prevent duplicates
         session_start_index = 0
         current_session_violation = None  # Track if current session already has a violation
@@ -170,8 +192,8 @@ class LegalViolationTracker:
             current_event = events[i]
 
             # Calculate gap between consecutive bark start timestamps
-            previous_time = datetime.fromisoformat(previous_event.startTimestamp.replace('Z', '+00:00'))
-            current_time = datetime.fromisoformat(current_event.startTimestamp.replace('Z', '+00:00'))
+            previous_time = start_times[i-1]
+            current_time = start_times[i]
             gap_seconds = (current_time - previous_time).total_seconds()
             if i <= 5:  # Only print first few for debugging
                 print(f"DEBUG: Event {i}: gap={gap_seconds:.1f}s (prev={previous_event.startTimestamp}, curr={current_event.startTimestamp})")
@@ -184,7 +206,7 @@ class LegalViolationTracker:
 
             # Session continues - check if duration meets violation criteria
             first_event = events[session_start_index]
-            first_time = datetime.fromisoformat(first_event.startTimestamp.replace('Z', '+00:00'))
+            first_time = start_times[session_start_index]
             session_duration_seconds = (current_time - first_time).total_seconds()
             session_duration_minutes = session_duration_seconds / 60
 
@@ -213,12 +235,14 @@ class LegalViolationTracker:
 
         return violations
 
-    def _analyze_intermittent_violations_from_events(self, events: List[AlgorithmInputEvent], intermittent_gap_threshold: float = None) -> List[Violation]:
+    def _analyze_intermittent_violations_from_events(self, events: List[AlgorithmInputEvent], intermittent_gap_threshold: float = None,
+                                                     start_times: Optional[List[datetime]] = None) -> List[Violation]:
         """Find intermittent violations using start timestamp intervals per formal algorithm.
 
         Args:
             events: List of AlgorithmInputEvent objects sorted by startTimestamp
             intermittent_gap_threshold: Maximum gap in seconds between consecutive bark events (uses config if None)
+            start_times: Parsed startTimestamp of each event, from _parse_start_times (parsed here if None)
 
         Returns:
             List of Violation objects for detected intermittent violations
@@ -231,17 +255,19 @@ class LegalViolationTracker:
         if len(events) < 2:
             return violations
 
+        if start_times is None:
+            start_times = self._parse_start_times(events)
+
         # Track sessions and their violations to prevent duplicates
         session_start_index = 0
         current_session_violation = None  # Track if current session already has a violation
 
         for i in range(1, len(events)):
-            previous_event = events[i-1]
             current_event = events[i]
 
             # Calculate gap between consecutive bark start timestamps
-            previous_time = datetime.fromisoformat(previous_event.startTimestamp.replace('Z', '+00:00'))
-            current_time = datetime.fromisoformat(current_event.startTimestamp.replace('Z', '+00:00'))
+            previous_time = start_times[i-1]
+            current_time = start_times[i]
             gap_seconds = (current_time - previous_time).total_seconds()
 
             if gap_seconds >= intermittent_gap_threshold:  # intermittent_gap_threshold is in seconds
@@ -252,7 +278,7 @@ class LegalViolationTracker:
 
             # Session continues - check if duration meets violation criteria
             first_event = events[session_start_index]
-            first_time = datetime.fromisoformat(first_event.startTimestamp.replace('Z', '+00:00'))
+            first_time = start_times[session_start_index]
             session_duration_seconds = (current_time - first_time).total_seconds()
             session_duration_minutes = session_duration_seconds / 60
 
@@ -560,9 +586,8 @@ class LegalViolationTracker:
 
         # Apply formal violation detection algorithms
         print(f"DEBUG: Calling constant violations analysis with {len(algorithm_events)} events")
-        constant_violations = self._analyze_constant_violations_from_events(algorithm_events)
+        constant_violations, intermittent_violations = self._analyze_violations_from_events(algorithm_events)
         print(f"DEBUG: Constant violations found: {len(constant_violations)}")
-        intermittent_violations = self._analyze_intermittent_violations_from_events(algorithm_events)
         print(f"DEBUG: Intermittent violations found: {len(intermittent_violations)}")
 
         # Combine all violations (now Violation objects from formal algorithm)
@@ -8,21 +8,28 @@ Monitors audio input and records when barking is detected using machine learning
 import os
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'  # 0=all, 1=no INFO, 2=no INFO/WARNING, 3=no INFO/WARNING/ERROR
 
-import pyaudio
 import numpy as np
+import soundfile as sf
 import wave
 import time
 import os
 import threading
 import logging
+import logging.handlers
+import queue
+import atexit
+import math
 import csv
-import io
+import hashlib
+import bisect
+import importlib.util
+from collections import defaultdict, deque
 from datetime import datetime
 from typing import Optional, List, Tuple, Dict
-from dataclasses import dataclass
-import tensorflow as tf
-import tensorflow_hub as hub
-import librosa
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import argparse
 import sys
 import select
@@ -31,15 +38,25 @@ import tty
 import json
 from pathlib import Path
 
-# Configure logging
+# Configure logging. Records are queued and written to the log file and
+# console by a background listener thread, so long listings don't stall the
+# main thread on I/O. The listener is stopped (and drained) at exit.
+_log_handlers = [
+    logging.FileHandler('bark_detector.log'),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+_log_queue = queue.SimpleQueue()
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Listener handlers add the prefix
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('bark_detector.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[_queue_handler]
 )
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 
@@ -76,7 +93,28 @@ def convert_numpy_types(obj):
         return obj
 
 
-@dataclass
+def sort_by_start_time(items: list) -> list:
+    """
+    Return items ordered by their start_time attribute.
+    Keys are packed into one float64 array and ordered with a stable
+    np.argsort, avoiding a Python key callback per comparison.
+    
+    Args:
+        items: Objects exposing a numeric start_time (sessions or events)
+        
+    Returns:
+        New list with the same objects in ascending start_time order
+    """
+    keys = np.fromiter((item.start_time for item in items), dtype=np.float64, count=len(items))
+    order = np.argsort(keys, kind='stable')
+    return [items[i] for i in order.tolist()]
+
+
+# dataclass(slots=True) needs Python 3.10+; on 3.9 the models fall back to a __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class BarkEvent:
     """Represents a detected barking event."""
     start_time: float
@@ -85,7 +123,7 @@ class BarkEvent:
     intensity: float = 0.0
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class BarkingSession:
     """Represents a continuous barking session."""
     start_time: float
@@ -101,7 +139,7 @@ class BarkingSession:
     file_start_timestamp: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CalibrationProfile:
     """Stores calibration settings for a specific environment."""
     name: str
@@ -116,7 +154,7 @@ class CalibrationProfile:
     def save(self, filepath: Path):
         """Save profile to JSON file."""
         with open(filepath, 'w') as f:
-            json.dump(self.__dict__, f, indent=2)
+            json.dump(asdict(self), f, indent=2)
     
     @classmethod
     def load(cls, filepath: Path):
@@ -126,7 +164,7 @@ class CalibrationProfile:
         return cls(**data)
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class GroundTruthEvent:
     """Represents a ground truth bark event with timestamp."""
     start_time: float
@@ -135,7 +173,7 @@ class GroundTruthEvent:
     confidence_expected: float = 1.0
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LegalSporadicSession:
     """Represents a legal sporadic session for bylaw violation detection."""
     start_time: float
@@ -147,7 +185,7 @@ class LegalSporadicSession:
     is_violation: bool = False
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ViolationReport:
     """Represents a detected bylaw violation with RDCO-compliant information."""
     date: str  # YYYY-MM-DD format
@@ -175,8 +213,26 @@ class ViolationDatabase:
         
         self.db_path = db_path
         self.violations: List[ViolationReport] = []
+        self._last_saved_digest: Optional[bytes] = None
+        
+        # Secondary index: date -> violations, plus the sorted list of dates
+        self._by_date: Dict[str, List[ViolationReport]] = defaultdict(list)
+        self._sorted_dates: List[str] = []
         self._load_violations()
     
+    def _index_violation(self, violation: ViolationReport):
+        """Add a violation to the date index."""
+        if violation.date not in self._by_date:
+            bisect.insort(self._sorted_dates, violation.date)
+        self._by_date[violation.date].append(violation)
+    
+    def _rebuild_date_index(self):
+        """Rebuild the date index from self.violations."""
+        self._by_date = defaultdict(list)
+        self._sorted_dates = []
+        for violation in self.violations:
+            self._index_violation(violation)
+    
     def _load_violations(self):
         """Load existing violations from database file."""
         try:
@@ -195,6 +251,8 @@ class ViolationDatabase:
         except Exception as e:
             logger.warning(f"Could not load violation database: {e}")
             self.violations = []
+        
+        self._rebuild_date_index()
     
     def save_violations(self):
         """Save violations to database file."""
@@ -222,8 +280,20 @@ class ViolationDatabase:
                 ]
             }
             
-            with open(self.db_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            payload = json.dumps(data, indent=2)
+            
+            # Skip the write entirely when nothing changed since the last save
+            digest = hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+            if digest == self._last_saved_digest and self.db_path.exists():
+                return
+            
+            # Write to a sibling temp file and swap it in so a crash mid-write
+            # never leaves a truncated database behind
+            tmp_path = self.db_path.with_suffix(self.db_path.suffix + '.tmp')
+            with open(tmp_path, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.db_path)
+            self._last_saved_digest = digest
                 
         except Exception as e:
             logger.error(f"Could not save violation database: {e}")
@@ -231,18 +301,18 @@ class ViolationDatabase:
     def add_violation(self, violation: ViolationReport):
         """Add a violation report to the database."""
         self.violations.append(violation)
+        self._index_violation(violation)
         self.save_violations()
     
     def get_violations_by_date_range(self, start_date: str, end_date: str) -> List[ViolationReport]:
         """Get violations within date range (YYYY-MM-DD format)."""
-        return [
-            v for v in self.violations 
-            if start_date <= v.date <= end_date
-        ]
+        lo = bisect.bisect_left(self._sorted_dates, start_date)
+        hi = bisect.bisect_right(self._sorted_dates, end_date)
+        return [v for date in self._sorted_dates[lo:hi] for v in self._by_date[date]]
     
     def get_violations_by_date(self, date: str) -> List[ViolationReport]:
         """Get violations for specific date (YYYY-MM-DD format)."""
-        return [v for v in self.violations if v.date == date]
+        return list(self._by_date.get(date, ()))
     
     def export_to_csv(self, output_path: Path) -> None:
         """Export violations to CSV format for RDCO submission."""
@@ -308,7 +378,7 @@ class LegalViolationTracker:
             return []
         
         # Sort sessions by start time
-        sorted_sessions = sorted(sessions, key=lambda x: x.start_time)
+        sorted_sessions = sort_by_start_time(sessions)
         
         # Group sessions into legal sporadic sessions
         legal_sessions = self._group_sessions_into_legal_sessions(sorted_sessions)
@@ -381,9 +451,15 @@ class LegalViolationTracker:
         """Detect continuous violations within a legal sporadic session."""
         violations = []
         
+        # Sessions that already qualify on their own (ids, so Method 2 can skip them cheaply)
+        long_session_ids = {
+            id(session) for session in legal_session.barking_sessions
+            if session.total_duration >= self.continuous_violation_threshold
+        }
+        
         # Method 1: Check individual sessions ≥ 5 minutes
         for session in legal_session.barking_sessions:
-            if session.total_duration >= self.continuous_violation_threshold:
+            if id(session) in long_session_ids:
                 violation = self._create_violation_report(
                     sessions=[session],
                     violation_type="Constant",
@@ -394,39 +470,56 @@ class LegalViolationTracker:
                 violations.append(violation)
         
         # Method 2: Check sequences of sessions with gaps ≤ 30 seconds that total ≥ 5 minutes
-        sequence_violations = self._detect_continuous_sequences(legal_session.barking_sessions, recording_date)
+        sequence_violations = self._detect_continuous_sequences(
+            legal_session.barking_sessions, recording_date, long_session_ids
+        )
         violations.extend(sequence_violations)
         
         return violations
     
-    def _detect_continuous_sequences(self, sessions: List[BarkingSession], recording_date: str) -> List[ViolationReport]:
-        """Detect continuous violation sequences (sessions with gaps ≤30s totaling ≥5min)."""
+    def _detect_continuous_sequences(self, sessions: List[BarkingSession], recording_date: str,
+                                     long_session_ids: Optional[set] = None) -> List[ViolationReport]:
+        """
+        Detect continuous violation sequences (sessions with gaps ≤30s totaling ≥5min).
+        
+        Args:
+            sessions: Barking sessions sorted by start time
+            recording_date: Date string (YYYY-MM-DD) for the recordings
+            long_session_ids: ids of sessions already reported as single-session
+                violations; computed from sessions when not given
+        """
         violations = []
         
         if len(sessions) < 2:
             return violations
         
+        if long_session_ids is None:
+            long_session_ids = {
+                id(session) for session in sessions
+                if session.total_duration >= self.continuous_violation_threshold
+            }
+        
+        session_count = len(sessions)
         i = 0
-        while i < len(sessions):
-            # Start a potential sequence
-            sequence_sessions = [sessions[i]]
+        while i < session_count:
+            # Start a potential sequence covering sessions[i:j]
             sequence_bark_duration = sessions[i].total_duration
             j = i + 1
             
             # Extend sequence while gaps are ≤ 30 seconds
-            while j < len(sessions):
-                gap = sessions[j].start_time - sequence_sessions[-1].end_time
+            while j < session_count:
+                gap = sessions[j].start_time - sessions[j - 1].end_time
                 if gap <= self.sequence_gap_threshold:
-                    sequence_sessions.append(sessions[j])
                     sequence_bark_duration += sessions[j].total_duration
                     j += 1
                 else:
                     break
             
             # Check if sequence qualifies as continuous violation
-            if len(sequence_sessions) > 1 and sequence_bark_duration >= self.continuous_violation_threshold:
+            if j - i > 1 and sequence_bark_duration >= self.continuous_violation_threshold:
+                sequence_sessions = sessions[i:j]
                 # Make sure we haven't already detected this as a single session violation
-                if not any(session.total_duration >= self.continuous_violation_threshold for session in sequence_sessions):
+                if not any(id(session) in long_session_ids for session in sequence_sessions):
                     violation = self._create_violation_report(
                         sessions=sequence_sessions,
                         violation_type="Constant",
@@ -436,8 +529,10 @@ class LegalViolationTracker:
                     )
                     violations.append(violation)
             
-            # Move to next potential sequence start
-            i = max(i + 1, j)
+            # Every session in [i, j) was consumed by this sweep, and any sequence
+            # starting inside it would end at the same gap with less bark time,
+            # so resume at j (always > i): each session is visited once
+            i = j
         
         return violations
     
@@ -462,13 +557,15 @@ class LegalViolationTracker:
         total_bark_duration = sum(session.total_duration for session in sessions)
         total_incident_duration = end_time - start_time
         
-        # Extract confidence data
-        all_confidences = []
-        for session in sessions:
-            all_confidences.extend([event.confidence for event in session.events])
+        # Extract confidence data into a single preallocated array
+        confidence_count = sum(len(session.events) for session in sessions)
+        all_confidences = np.fromiter(
+            chain.from_iterable((event.confidence for event in session.events) for session in sessions),
+            dtype=np.float64, count=confidence_count
+        )
         
-        peak_confidence = max(all_confidences) if all_confidences else 0.0
-        avg_confidence = sum(all_confidences) / len(all_confidences) if all_confidences else 0.0
+        peak_confidence = all_confidences.max() if confidence_count else 0.0
+        avg_confidence = all_confidences.mean() if confidence_count else 0.0
         
         # Convert timestamps to readable format
         start_dt = datetime.fromtimestamp(start_time)
@@ -587,13 +684,68 @@ class LegalViolationTracker:
         return violations
 
 
+_RECORDING_PREFIX = 'bark_recording_'
+
+
+@lru_cache(maxsize=4096)
+def _recording_filename_timestamp(filename: str) -> float:
+    """
+    Parse bark_recording_YYYYMMDD_HHMMSS.wav into a POSIX timestamp.
+    Fields sit at fixed offsets, so they are sliced directly instead of
+    going through split() and strptime(). Returns 0.0 when unparseable.
+    """
+    if not filename.startswith(_RECORDING_PREFIX):
+        return 0.0
+
+    try:
+        if filename[23] != '_':
+            raise ValueError("missing date/time separator")
+        return datetime(
+            int(filename[15:19]), int(filename[19:21]), int(filename[21:23]),
+            int(filename[24:26]), int(filename[26:28]), int(filename[28:30])
+        ).timestamp()
+    except (ValueError, IndexError) as e:
+        logger.warning(f"Could not parse timestamp from filename {filename}: {e}")
+
+    return 0.0
+
+
 class RecordingFileParser:
     """Parser for analyzing existing recording files and reconstructing sessions."""
-    
+
+    # Long recordings are analyzed in 60s blocks overlapping by one YAMNet frame
+    BLOCK_DURATION = 60.0
+    BLOCK_OVERLAP = 0.48
+
     def __init__(self, detector: 'AdvancedBarkDetector'):
         """Initialize recording file parser."""
         self.detector = detector
-        
+
+    def _iter_audio_blocks(self, recording_path: Path):
+        """
+        Yield (block_start_seconds, audio_block) pairs for a recording.
+        Mono files at the detector sample rate are streamed from disk; anything
+        else is decoded and resampled in one pass with librosa.
+        """
+
+        sample_rate = self.detector.sample_rate
+        info = sf.info(str(recording_path))
+
+        if info.samplerate != sample_rate or info.channels != 1:
+            import librosa
+            audio_data, _ = librosa.load(str(recording_path), sr=sample_rate, mono=True)
+            yield 0.0, audio_data
+            return
+
+        blocksize = int(self.BLOCK_DURATION * sample_rate)
+        overlap = int(self.BLOCK_OVERLAP * sample_rate)
+        step = blocksize - overlap
+
+        blocks = sf.blocks(str(recording_path), blocksize=blocksize, overlap=overlap,
+                           dtype='float32', always_2d=False)
+        for index, block in enumerate(blocks):
+            yield index * step / sample_rate, block
+
     def get_recordings_for_date(self, recordings_dir: Path, target_date: str) -> List[Path]:
         """
         Get all recording files for a specific date.
@@ -638,22 +790,7 @@ class RecordingFileParser:
         Extract timestamp from recording filename.
         Expected format: bark_recording_YYYYMMDD_HHMMSS.wav
         """
-        try:
-            # Remove extension and split
-            name_parts = filename.replace('.wav', '').split('_')
-            if len(name_parts) >= 4 and name_parts[0] == 'bark' and name_parts[1] == 'recording':
-                date_str = name_parts[2]  # YYYYMMDD
-                time_str = name_parts[3]  # HHMMSS
-                
-                # Parse date and time
-                from datetime import datetime
-                dt_str = f"{date_str}_{time_str}"
-                dt = datetime.strptime(dt_str, "%Y%m%d_%H%M%S")
-                return dt.timestamp()
-        except Exception as e:
-            logger.warning(f"Could not parse timestamp from filename {filename}: {e}")
-        
-        return 0.0
+        return _recording_filename_timestamp(filename)
     
     def analyze_recording_file(self, recording_path: Path) -> List[BarkingSession]:
         """
@@ -666,38 +803,51 @@ class RecordingFileParser:
             List of BarkingSession objects detected in the file
         """
         try:
-            import librosa
-            
             logger.info(f"Analyzing recording: {recording_path.name}")
-            
-            # Load audio file
-            audio_data, sample_rate = librosa.load(str(recording_path), sr=16000, mono=True)
-            
-            if len(audio_data) == 0:
-                logger.warning(f"Empty audio file: {recording_path}")
-                return []
-            
+
             # Get file timestamp from filename
             file_timestamp = self._extract_timestamp_from_filename(recording_path.name)
-            
-            # Detect bark events in the recording
-            bark_events = self.detector._detect_barks_in_buffer(audio_data)
-            
+
+            # Detect bark events block by block so peak memory stays bounded
+            # by the block size rather than the length of the recording
+            bark_events = []
+            has_audio = False
+            for block_start, block in self._iter_audio_blocks(recording_path):
+                if len(block) == 0:
+                    continue
+                has_audio = True
+
+                for event in self.detector._detect_barks_in_buffer(block):
+                    # Intensity is measured against the block the event came from
+                    event.intensity = self.detector._calculate_event_intensity(
+                        block,
+                        int(event.start_time * self.detector.sample_rate),
+                        int(event.end_time * self.detector.sample_rate),
+                        event.confidence
+                    )
+                    event.start_time += block_start
+                    event.end_time += block_start
+
+                    # Events inside the block overlap are seen twice; stitch them
+                    if bark_events and event.start_time < bark_events[-1].end_time:
+                        previous = bark_events[-1]
+                        previous.end_time = max(previous.end_time, event.end_time)
+                        continue
+                    bark_events.append(event)
+
+            if not has_audio:
+                logger.warning(f"Empty audio file: {recording_path}")
+                return []
+
             if not bark_events:
                 logger.info(f"No barks detected in {recording_path.name}")
                 return []
-            
+
             # Adjust event timestamps to real time based on file timestamp
-            duration = len(audio_data) / sample_rate
             for event in bark_events:
                 event.start_time = file_timestamp + event.start_time
                 event.end_time = file_timestamp + event.end_time
-                # Calculate intensity
-                event.intensity = self.detector._calculate_event_intensity(audio_data, 
-                    BarkEvent(event.start_time - file_timestamp, 
-                             event.end_time - file_timestamp, 
-                             event.confidence))
-            
+
             # Group events into barking sessions
             sessions = self.detector._group_events_into_sessions(bark_events)
             
@@ -739,7 +889,7 @@ class RecordingFileParser:
             all_sessions.extend(sessions)
         
         # Sort sessions by start time
-        all_sessions.sort(key=lambda x: x.start_time)
+        all_sessions = sort_by_start_time(all_sessions)
         
         logger.info(f"Total sessions for {target_date}: {len(all_sessions)}")
         
@@ -836,7 +986,6 @@ class AudioFileConverter:
         """
         try:
             import librosa
-            import soundfile as sf
             import shutil
             
             # Check if already converted
@@ -1023,6 +1172,136 @@ class AudioFileConverter:
         return results
 
 
+def event_centers(events) -> np.ndarray:
+    """Midpoints of events with start_time/end_time as a float64 array."""
+    return np.fromiter(
+        ((e.start_time + e.end_time) / 2 for e in events),
+        dtype=np.float64, count=len(events)
+    )
+
+
+def count_matches_within_tolerance(times_a: np.ndarray, times_b: np.ndarray, tolerance: float) -> int:
+    """
+    Count the largest set of one-to-one pairs between two sets of event
+    times that lie within tolerance of each other.
+    
+    Solved as an assignment problem over the |a - b| distance matrix.
+    Out-of-tolerance pairs cost more than any complete valid matching, so
+    the solver maximizes the number of matches first and total distance
+    second (never fewer matches than a greedy first-fit pass).
+    
+    Args:
+        times_a: 1-D array of event times (e.g. detection centers)
+        times_b: 1-D array of reference times (e.g. ground truth centers)
+        tolerance: Maximum allowed distance between paired times
+        
+    Returns:
+        Number of matched pairs
+    """
+    if len(times_a) == 0 or len(times_b) == 0:
+        return 0
+    
+    distances = np.abs(np.asarray(times_a, dtype=np.float64)[:, None] -
+                       np.asarray(times_b, dtype=np.float64)[None, :])
+    within = distances <= tolerance
+    if not within.any():
+        return 0
+    
+    from scipy.optimize import linear_sum_assignment
+    penalty = tolerance * min(distances.shape) + 1.0
+    rows, cols = linear_sum_assignment(np.where(within, distances, penalty))
+    return int(within[rows, cols].sum())
+
+
+AUDIO_INFO_CACHE_PATH = Path.home() / '.bark_detector' / 'audio_info_cache.json'
+
+
+def _probe_audio_info(path_str: str) -> Optional[Tuple[float, int]]:
+    """
+    Read duration and sample rate from the file header without decoding.
+    
+    Falls back to mutagen (when installed) for containers libsndfile cannot
+    open, such as m4a/aac.
+    
+    Returns:
+        (duration_seconds, sample_rate), or None if the header is unreadable
+    """
+    try:
+        info = sf.info(path_str)
+        return info.duration, info.samplerate
+    except RuntimeError:
+        # soundfile's open errors (SoundFileError/LibsndfileError) derive from RuntimeError
+        pass
+    
+    try:
+        import mutagen
+    except ImportError:
+        return None
+    
+    try:
+        media = mutagen.File(path_str)
+    except mutagen.MutagenError:
+        return None
+    if media is None or media.info is None:
+        return None
+    return media.info.length, getattr(media.info, 'sample_rate', 0)
+
+
+# Suffix of pre-converted 16kHz mono float audio that _load_audio_16k memory-maps
+PRECONVERTED_AUDIO_SUFFIX = '.16k.npy'
+
+
+def _load_audio_16k(path_str: str) -> np.ndarray:
+    """
+    Decode an audio file to mono float32 at 16kHz.
+    Decoded buffers are memoized (keyed on path, mtime and size so edited
+    files are re-read) and returned read-only because they are shared.
+    
+    For long recordings, a pre-converted 16kHz mono float copy saved with the
+    dedicated suffix (e.g. ``np.save('clip.16k.npy', audio)`` next to
+    ``clip.wav``) that is newer than the audio file is memory-mapped instead,
+    so the samples are neither decoded nor held in memory. A copy that isn't
+    1-D float audio is ignored with a warning.
+    """
+    stat = os.stat(path_str)
+    path = Path(path_str)
+    npy_path = path.with_name(path.stem + PRECONVERTED_AUDIO_SUFFIX)
+    try:
+        if npy_path.stat().st_mtime_ns >= stat.st_mtime_ns:
+            audio_data = np.load(npy_path, mmap_mode='r')
+            if audio_data.ndim == 1 and np.issubdtype(audio_data.dtype, np.floating):
+                return audio_data
+            logger.warning(f"Ignoring {npy_path.name}: expected 1-D float audio, "
+                           f"got shape {audio_data.shape} {audio_data.dtype}")
+    except (OSError, ValueError):
+        pass
+    return _decode_audio_16k(path_str, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=64)
+def _decode_audio_16k(path_str: str, mtime_ns: int, size: int) -> np.ndarray:
+    """
+    Decode helper for _load_audio_16k. Reads through soundfile directly and
+    only resamples when the native rate differs (soxr when installed,
+    librosa otherwise).
+    """
+    
+    audio_data, sample_rate = sf.read(path_str, dtype='float32', always_2d=False)
+    if audio_data.ndim > 1:
+        audio_data = audio_data.mean(axis=1)
+    
+    if sample_rate != 16000:
+        try:
+            import soxr
+            audio_data = soxr.resample(audio_data, sample_rate, 16000)
+        except ImportError:
+            import librosa
+            audio_data = librosa.resample(audio_data, orig_sr=sample_rate, target_sr=16000)
+    
+    audio_data.flags.writeable = False
+    return audio_data
+
+
 class FileBasedCalibration:
     """File-based calibration using ground truth timestamps."""
     
@@ -1061,6 +1340,7 @@ class FileBasedCalibration:
             'audio_path': converted_path,
             'original_path': audio_path,
             'ground_truth': events,
+            'gt_centers': event_centers(events),
             'is_negative': len(events) == 0
         })
         
@@ -1076,7 +1356,6 @@ class FileBasedCalibration:
         # If already WAV, check if it needs resampling
         if audio_path.suffix.lower() == '.wav':
             try:
-                import soundfile as sf
                 info = sf.info(str(audio_path))
                 if info.samplerate == 16000 and info.channels == 1:
                     return audio_path  # Already in correct format
@@ -1090,7 +1369,6 @@ class FileBasedCalibration:
     def _convert_audio_file(self, audio_path: Path) -> Path:
         """Convert audio file to WAV 16kHz mono format."""
         import librosa
-        import soundfile as sf
         
         # Create converted file path
         converted_dir = audio_path.parent / 'converted'
@@ -1138,55 +1416,105 @@ class FileBasedCalibration:
     
     def list_convertible_files(self, directory: Path) -> List[Dict]:
         """List audio files that can be converted for calibration."""
-        supported_patterns = ['*.wav', '*.m4a', '*.mp3', '*.aac', '*.flac']
+        supported_extensions = {'.wav', '.m4a', '.mp3', '.aac', '.flac'}
         found_files = []
         
-        for pattern in supported_patterns:
-            for file_path in directory.glob(pattern):
-                try:
-                    # Get basic info
-                    if file_path.suffix.lower() == '.m4a':
-                        # Could be Voice Memo
-                        composition_file = file_path.with_suffix('.composition')
-                        is_voice_memo = composition_file.exists()
-                    else:
-                        is_voice_memo = False
-                    
-                    # Get duration if possible
-                    try:
-                        import soundfile as sf
-                        info = sf.info(str(file_path))
-                        duration = info.duration
-                        sample_rate = info.samplerate
-                    except:
-                        duration = 0
-                        sample_rate = 0
-                    
-                    found_files.append({
-                        'path': file_path,
-                        'type': 'Voice Memo' if is_voice_memo else file_path.suffix.upper()[1:],
-                        'duration': duration,
-                        'sample_rate': sample_rate,
-                        'size_mb': file_path.stat().st_size / (1024 * 1024)
-                    })
-                    
-                except Exception as e:
-                    logger.debug(f"Could not analyze {file_path}: {e}")
+        # Single directory pass; DirEntry caches the type and stat results
+        with os.scandir(directory) as entries:
+            candidates = [
+                entry for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in supported_extensions
+                and entry.is_file()
+            ]
+        
+        audio_info = self._probe_audio_info_cached(candidates)
+        
+        for entry in candidates:
+            file_path = Path(entry.path)
+            try:
+                # Get basic info
+                if file_path.suffix.lower() == '.m4a':
+                    # Could be Voice Memo
+                    is_voice_memo = os.path.exists(os.path.splitext(entry.path)[0] + '.composition')
+                else:
+                    is_voice_memo = False
+                
+                # Get duration if possible (header only)
+                duration, sample_rate = audio_info.get(entry.path) or (0, 0)
+                
+                found_files.append({
+                    'path': file_path,
+                    'type': 'Voice Memo' if is_voice_memo else file_path.suffix.upper()[1:],
+                    'duration': duration,
+                    'sample_rate': sample_rate,
+                    'size_mb': entry.stat().st_size / (1024 * 1024)
+                })
+                
+            except Exception as e:
+                logger.debug(f"Could not analyze {file_path}: {e}")
         
         return sorted(found_files, key=lambda x: x['path'].name)
     
+    def _probe_audio_info_cached(self, entries: List[os.DirEntry]) -> Dict[str, Tuple[float, int]]:
+        """
+        Get (duration, sample_rate) for each directory entry.
+        
+        Results are cached in AUDIO_INFO_CACHE_PATH keyed by the file's path,
+        size and mtime, so only new or changed files have their headers read.
+        Those are probed on a thread pool since the probes are I/O-bound.
+        Files whose header can't be read are left out of the result.
+        """
+        try:
+            with open(AUDIO_INFO_CACHE_PATH, 'r') as f:
+                cache = json.load(f)
+            if not isinstance(cache, dict):
+                cache = {}
+        except (OSError, ValueError):
+            cache = {}
+        
+        keys = {}
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            keys[entry.path] = [stat.st_size, stat.st_mtime_ns]
+        
+        def probe(path_str):
+            try:
+                return _probe_audio_info(path_str)
+            except Exception as e:
+                logger.debug(f"Could not read audio header of {path_str}: {e}")
+                return None
+        
+        to_probe = [path for path, key in keys.items()
+                    if not isinstance(cache.get(path), dict) or cache[path].get('key') != key]
+        if to_probe:
+            with ThreadPoolExecutor(max_workers=min(len(to_probe), 8)) as executor:
+                for path, info in zip(to_probe, executor.map(probe, to_probe)):
+                    if info is not None:
+                        cache[path] = {'key': keys[path], 'info': list(info)}
+            try:
+                AUDIO_INFO_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                with open(AUDIO_INFO_CACHE_PATH, 'w') as f:
+                    json.dump(cache, f)
+            except OSError as e:
+                logger.debug(f"Could not write audio info cache: {e}")
+        
+        return {
+            path: tuple(cache[path]['info'])
+            for path, key in keys.items()
+            if isinstance(cache.get(path), dict) and cache[path].get('key') == key
+        }
+    
     def create_ground_truth_template(self, audio_path: Path, output_path: Path = None):
         """Create a template ground truth file for manual annotation."""
         if output_path is None:
             output_path = audio_path.parent / f"{audio_path.stem}_ground_truth.json"
         
         # Get audio duration
-        import soundfile as sf
-        try:
-            info = sf.info(str(audio_path))
-            duration = info.duration
-        except Exception:
-            duration = 60.0  # Default if can't read
+        audio_info = _probe_audio_info(str(audio_path))
+        duration = audio_info[0] if audio_info else 60.0  # Default if can't read
         
         template = {
             "audio_file": str(audio_path),
@@ -1218,16 +1546,33 @@ class FileBasedCalibration:
         if not self.test_files:
             raise ValueError("No test files added. Use add_test_file() first.")
         
-        # Generate sensitivity values to test
-        sensitivity_values = np.linspace(sensitivity_range[0], sensitivity_range[1], steps)
+        # Generate sensitivity values to test (as plain Python floats)
+        sensitivity_values = np.linspace(sensitivity_range[0], sensitivity_range[1], steps).tolist()
+        
+        # YAMNet scores do not depend on sensitivity, so each file is scored
+        # once up front. Files are scored on a thread pool sharing the loaded
+        # model (TensorFlow releases the GIL during inference); each step
+        # below then only re-thresholds the cached scores. A process pool would
+        # have to import TensorFlow and load YAMNet again in every worker, which
+        # costs more than the (file, sensitivity) work it would spread out.
+        file_scores = {}
+        with ThreadPoolExecutor(max_workers=min(len(self.test_files), os.cpu_count() or 1)) as executor:
+            futures = {
+                executor.submit(self._score_test_file, test_file): j
+                for j, test_file in enumerate(self.test_files)
+            }
+            for future in as_completed(futures):
+                j = futures[future]
+                try:
+                    file_scores[j] = future.result()
+                except Exception as e:
+                    # Reported per sensitivity step by _test_single_file
+                    file_scores[j] = e
         
         sweep_results = []
         
         for i, sensitivity in enumerate(sensitivity_values):
-            logger.info(f"🎛️  Testing sensitivity {sensitivity:.3f} ({i+1}/{steps})")
-            
-            # Set detector sensitivity
-            self.detector.sensitivity = sensitivity
+            logger.info("🎛️  Testing sensitivity %.3f (%d/%d)", sensitivity, i + 1, steps)
             
             # Test all files at this sensitivity
             file_results = []
@@ -1236,8 +1581,8 @@ class FileBasedCalibration:
             total_missed = 0
             total_ground_truth = 0
             
-            for test_file in self.test_files:
-                result = self._test_single_file(test_file, sensitivity)
+            for j, test_file in enumerate(self.test_files):
+                result = self._test_single_file(test_file, sensitivity, file_scores[j])
                 file_results.append(result)
                 
                 total_matches += result['matches']
@@ -1264,7 +1609,8 @@ class FileBasedCalibration:
             
             sweep_results.append(sweep_result)
             
-            logger.info(f"   Precision: {precision:.1%}, Recall: {recall:.1%}, F1: {f1_score:.3f}")
+            logger.info("   Precision: %.1f%%, Recall: %.1f%%, F1: %.3f",
+                        precision * 100, recall * 100, f1_score)
         
         # Find optimal sensitivity
         best_result = max(sweep_results, key=lambda x: x['f1_score'])
@@ -1285,22 +1631,37 @@ class FileBasedCalibration:
             'all_results': sweep_results
         }
     
-    def _test_single_file(self, test_file: Dict, sensitivity: float) -> Dict:
-        """Test detection on a single file."""
+    def _score_test_file(self, test_file: Dict) -> np.ndarray:
+        """Load a test file and compute its per-frame YAMNet bark scores."""
+        audio_data = _load_audio_16k(str(test_file['audio_path']))
+        return self.detector._score_buffer(audio_data)
+    
+    def _test_single_file(self, test_file: Dict, sensitivity: float, bark_scores=None) -> Dict:
+        """
+        Test detection on a single file.
+        
+        Args:
+            test_file: Test file entry from add_test_file()
+            sensitivity: Detection threshold to evaluate
+            bark_scores: Precomputed scores from _score_test_file (or the
+                exception raised while scoring); scored here when None
+        """
         audio_path = test_file['audio_path']
         ground_truth = test_file['ground_truth']
         
         try:
-            # Load audio file
-            import librosa
-            audio_data, sample_rate = librosa.load(str(audio_path), sr=16000, mono=True)
+            if bark_scores is None:
+                bark_scores = self._score_test_file(test_file)
+            elif isinstance(bark_scores, Exception):
+                raise bark_scores
             
-            # Run detection
-            detected_events = self.detector._detect_barks_in_buffer(audio_data)
+            # Threshold the scores into events
+            detected_events = self.detector._scores_to_events_with_sensitivity(bark_scores, sensitivity)
             
             # Calculate matches
             matches, false_positives, missed = self._calculate_matches(
-                detected_events, ground_truth, tolerance=2.0
+                detected_events, ground_truth, tolerance=2.0,
+                gt_centers=test_file.get('gt_centers')
             )
             
             return {
@@ -1327,33 +1688,25 @@ class FileBasedCalibration:
     
     def _calculate_matches(self, detected_events: List[BarkEvent], 
                           ground_truth: List[GroundTruthEvent], 
-                          tolerance: float = 2.0) -> Tuple[int, int, int]:
-        """Calculate matches between detected and ground truth events."""
-        matches = 0
-        matched_detections = set()
-        matched_ground_truth = set()
-        
-        # Find matches (detected event overlaps with ground truth within tolerance)
-        for i, detected in enumerate(detected_events):
-            if i in matched_detections:
-                continue
-                
-            for j, gt_event in enumerate(ground_truth):
-                if j in matched_ground_truth:
-                    continue
-                
-                # Check for overlap or proximity
-                detected_center = (detected.start_time + detected.end_time) / 2
-                gt_center = (gt_event.start_time + gt_event.end_time) / 2
-                
-                if abs(detected_center - gt_center) <= tolerance:
-                    matches += 1
-                    matched_detections.add(i)
-                    matched_ground_truth.add(j)
-                    break
+                          tolerance: float = 2.0,
+                          gt_centers: Optional[np.ndarray] = None) -> Tuple[int, int, int]:
+        """
+        Calculate matches between detected and ground truth events.
+        
+        Args:
+            detected_events: Events produced by the detector
+            ground_truth: Expected events for the file
+            tolerance: Maximum center distance (seconds) for a match
+            gt_centers: Precomputed ground truth centers (from add_test_file)
+        """
+        if gt_centers is None:
+            gt_centers = event_centers(ground_truth)
+        
+        # Match event centers (detected event within tolerance of ground truth)
+        matches = count_matches_within_tolerance(event_centers(detected_events), gt_centers, tolerance)
         
-        false_positives = len(detected_events) - len(matched_detections)
-        missed = len(ground_truth) - len(matched_ground_truth)
+        false_positives = len(detected_events) - matches
+        missed = len(ground_truth) - matches
         
         return matches, false_positives, missed
     
@@ -1393,13 +1746,17 @@ class ManualRecorder:
         self.output_path = Path(output_path)
         self.sample_rate = 16000
         self.channels = 1
+        import pyaudio
         self.format = pyaudio.paInt16
+        self._pa_continue = pyaudio.paContinue  # Returned by the callback, which can't import
         self.chunk_size = 1024
         
-        # Audio recording
+        # Audio recording (written straight to a partial file by the callback)
         self.audio = None
         self.stream = None
-        self.frames = []
+        self.wav_file = None
+        self.partial_path = self.output_path.with_name(self.output_path.name + '.part')
+        self.bytes_recorded = 0
         self.is_recording = False
         
         # Terminal settings for non-blocking input
@@ -1436,6 +1793,7 @@ class ManualRecorder:
             
     def _setup_audio(self):
         """Initialize PyAudio."""
+        import pyaudio
         self.audio = pyaudio.PyAudio()
         
     def _setup_keyboard(self):
@@ -1449,16 +1807,24 @@ class ManualRecorder:
         if sys.platform != 'win32' and self.original_settings:
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.original_settings)
     
-    def _get_key(self):
-        """Get keyboard input without blocking."""
+    def _get_key(self, timeout: Optional[float] = 0):
+        """
+        Get keyboard input, waiting up to timeout seconds (None waits for a key).
+        """
         if sys.platform == 'win32':
             import msvcrt
             if msvcrt.kbhit():
                 key = msvcrt.getch()
                 return key.decode('utf-8') if isinstance(key, bytes) else key
+            # Console handles can't be select()ed on Windows; fall back to polling
+            time.sleep(0.1 if timeout is None else min(timeout, 0.1))
         else:
-            if select.select([sys.stdin], [], [], 0)[0]:
+            if select.select([sys.stdin], [], [], timeout)[0]:
                 key = sys.stdin.read(1)
+                if not key:
+                    # stdin at EOF stays readable; don't spin on it
+                    time.sleep(0.1)
+                    return None
                 return key
         return None
     
@@ -1467,7 +1833,8 @@ class ManualRecorder:
         running = True
         
         while running:
-            key = self._get_key()
+            # Nothing else is scheduled here, so block until a key arrives
+            key = self._get_key(timeout=None)
             
             if key:
                 if key == ' ':  # Space - toggle recording
@@ -1481,8 +1848,6 @@ class ManualRecorder:
                         self._stop_recording()
                     self._save_recording()
                     running = False
-                    
-            time.sleep(0.1)  # Small delay to prevent excessive CPU usage
     
     def _start_recording(self):
         """Start audio recording."""
@@ -1491,7 +1856,12 @@ class ManualRecorder:
             
         logger.info("🔴 Recording started... Press SPACE to stop")
         
-        self.frames = []
+        self.wav_file = wave.open(str(self.partial_path), 'wb')
+        self.wav_file.setnchannels(self.channels)
+        self.wav_file.setsampwidth(self.audio.get_sample_size(self.format))
+        self.wav_file.setframerate(self.sample_rate)
+        self.bytes_recorded = 0
+        
         self.stream = self.audio.open(
             format=self.format,
             channels=self.channels,
@@ -1517,32 +1887,39 @@ class ManualRecorder:
             self.stream.stop_stream()
             self.stream.close()
             self.stream = None
+        
+        # Stream is stopped, so the callback can no longer write; finalize the header
+        if self.wav_file:
+            self.wav_file.close()
+            self.wav_file = None
     
     def _audio_callback(self, in_data, frame_count, time_info, status):
         """Audio callback for recording."""
-        if self.is_recording:
-            self.frames.append(in_data)
-        return (in_data, pyaudio.paContinue)
+        if self.is_recording and self.wav_file:
+            self.wav_file.writeframesraw(in_data)
+            self.bytes_recorded += len(in_data)
+        return (in_data, self._pa_continue)
+    
+    def _discard_partial(self):
+        """Remove an unsaved partial recording."""
+        try:
+            self.partial_path.unlink()
+        except FileNotFoundError:
+            pass
     
     def _save_recording(self):
         """Save recorded audio to file."""
-        if not self.frames:
+        if self.bytes_recorded == 0:
             logger.info("❌ No audio recorded")
+            self._discard_partial()
             return
             
         try:
-            # Combine all frames
-            audio_data = b''.join(self.frames)
-            
-            # Save as WAV file
-            with wave.open(str(self.output_path), 'wb') as wav_file:
-                wav_file.setnchannels(self.channels)
-                wav_file.setsampwidth(self.audio.get_sample_size(self.format))
-                wav_file.setframerate(self.sample_rate)
-                wav_file.writeframes(audio_data)
+            # Audio is already on disk; move the finished file into place
+            os.replace(self.partial_path, self.output_path)
             
             # Calculate duration
-            duration = len(audio_data) / (self.sample_rate * self.channels * 2)  # 2 bytes per sample
+            duration = self.bytes_recorded / (self.sample_rate * self.channels * 2)  # 2 bytes per sample
             
             logger.info(f"✅ Recording saved: {self.output_path}")
             logger.info(f"   Duration: {duration:.1f} seconds")
@@ -1560,6 +1937,9 @@ class ManualRecorder:
         """Clean up resources."""
         if self.is_recording:
             self._stop_recording()
+        
+        # Anything still in the partial file was cancelled, not saved
+        self._discard_partial()
             
         if self.audio:
             self.audio.terminate()
@@ -1580,6 +1960,13 @@ class CalibrationMode:
         self.system_detections = []
         self.sensitivity_history = []
         
+        # Running match count for status updates; exact matching runs at the end
+        self.match_tolerance = 3.0
+        self._running_matches = 0
+        self._unmatched_marks = deque()
+        self._unmatched_detections = deque()
+        self._match_lock = threading.Lock()
+        
         # Terminal settings for non-blocking input
         self.original_settings = None
         self.is_calibrating = False
@@ -1621,13 +2008,15 @@ class CalibrationMode:
             except Exception as e:
                 logger.warning(f"Could not restore keyboard settings: {e}")
     
-    def _check_keyboard_input(self):
-        """Check for keyboard input without blocking."""
+    def _check_keyboard_input(self, timeout: float = 0):
+        """Wait up to timeout seconds for keyboard input."""
         if self.original_settings is None:
+            if timeout > 0:
+                time.sleep(timeout)
             return None
             
         try:
-            if select.select([sys.stdin], [], [], 0)[0]:
+            if select.select([sys.stdin], [], [], timeout)[0]:
                 key = sys.stdin.read(1)
                 return key
         except Exception:
@@ -1639,20 +2028,24 @@ class CalibrationMode:
         last_status_update = time.time()
         last_optimization = time.time()
         
+        end_time = self.start_time + self.duration_seconds
+        
         while self.is_calibrating:
-            current_time = time.time()
-            elapsed = current_time - self.start_time
-            
             # Check if calibration time is up
-            if elapsed >= self.duration_seconds:
+            if time.time() >= end_time:
                 logger.info("⏰ Calibration time completed")
                 break
             
-            # Check for keyboard input
-            key = self._check_keyboard_input()
+            # Block for keyboard input until the next scheduled event is due
+            next_event = min(end_time, last_status_update + 5.0, last_optimization + 30.0)
+            key = self._check_keyboard_input(timeout=max(0.0, next_event - time.time()))
+            
+            current_time = time.time()
+            elapsed = current_time - self.start_time
+            
             if key:
                 if key == ' ':  # Spacebar
-                    self._mark_human_bark(current_time)
+                    self._mark_human_bark(elapsed)
                 elif key == '\x1b':  # ESC
                     logger.info("🛑 Calibration ended by user")
                     break
@@ -1669,8 +2062,6 @@ class CalibrationMode:
             if current_time - last_optimization >= 30.0:
                 self._auto_optimize_sensitivity()
                 last_optimization = current_time
-            
-            time.sleep(0.1)
         
         # Generate calibration results
         return self._generate_calibration_results()
@@ -1678,6 +2069,7 @@ class CalibrationMode:
     def _mark_human_bark(self, timestamp: float):
         """Record human bark marking."""
         self.human_marks.append(timestamp)
+        self._update_running_matches(timestamp, self._unmatched_marks, self._unmatched_detections)
         logger.info(f"👤 Human marked bark at {timestamp:.1f}s")
     
     def record_system_detection(self, bark_event: BarkEvent):
@@ -1689,6 +2081,31 @@ class CalibrationMode:
             'intensity': bark_event.intensity,
             'duration': bark_event.end_time - bark_event.start_time
         })
+        self._update_running_matches(detection_time, self._unmatched_detections, self._unmatched_marks)
+    
+    def _update_running_matches(self, event_time: float, own_unmatched: deque, other_unmatched: deque):
+        """
+        Pair a new mark/detection with the oldest unmatched event on the other side.
+        
+        Both streams arrive in time order, so unmatched events older than the
+        tolerance window can never match again and are dropped from the front.
+        """
+        with self._match_lock:
+            while other_unmatched and other_unmatched[0] < event_time - self.match_tolerance:
+                other_unmatched.popleft()
+            
+            if other_unmatched:
+                other_unmatched.popleft()
+                self._running_matches += 1
+            else:
+                own_unmatched.append(event_time)
+    
+    def _running_match_counts(self) -> Tuple[int, int, int]:
+        """Current (matches, false positives, missed) from the running counter."""
+        matches = self._running_matches
+        return (matches,
+                len(self.system_detections) - matches,
+                len(self.human_marks) - matches)
     
     def _show_status(self, elapsed: float):
         """Show calibration status."""
@@ -1697,7 +2114,7 @@ class CalibrationMode:
         system_count = len(self.system_detections)
         
         # Calculate match rate
-        matches, false_pos, missed = self._calculate_matches()
+        matches, false_pos, missed = self._running_match_counts()
         match_rate = matches / max(human_count, 1) * 100
         
         # Clear screen and show status
@@ -1705,25 +2122,21 @@ class CalibrationMode:
         print(f"\r\033[K📊 Human: {human_count} | System: {system_count} | Match: {match_rate:.0f}% | Sensitivity: {self.detector.sensitivity:.3f}")
         print(f"\r\033[K✅ Matches: {matches} | ❌ False+: {false_pos} | ❓ Missed: {missed}")
         
-    def _calculate_matches(self, tolerance: float = 3.0):
+    def _calculate_matches(self, tolerance: Optional[float] = None):
         """Calculate matches between human marks and system detections."""
-        matches = 0
-        false_positives = 0
+        if tolerance is None:
+            tolerance = self.match_tolerance
         
         # Find matches (system detection within tolerance of human mark)
-        matched_detections = set()
-        
-        for human_time in self.human_marks:
-            for i, detection in enumerate(self.system_detections):
-                if i in matched_detections:
-                    continue
-                if abs(detection['time'] - human_time) <= tolerance:
-                    matches += 1
-                    matched_detections.add(i)
-                    break
+        detection_times = np.fromiter(
+            (detection['time'] for detection in self.system_detections),
+            dtype=np.float64, count=len(self.system_detections)
+        )
+        matches = count_matches_within_tolerance(np.asarray(self.human_marks, dtype=np.float64),
+                                                 detection_times, tolerance)
         
         # Count false positives (unmatched detections)
-        false_positives = len(self.system_detections) - len(matched_detections)
+        false_positives = len(self.system_detections) - matches
         
         # Count missed (unmatched human marks)
         missed = len(self.human_marks) - matches
@@ -1795,6 +2208,171 @@ class CalibrationMode:
         return results
 
 
+INT16_SCALE = np.float32(1.0 / 32768.0)  # int16 PCM -> [-1, 1) float32
+
+# Numba ships with librosa; when it is missing the NumPy versions below are used.
+# Only its presence is checked here: importing it is slow, so warm_up_kernels()
+# does that once detection is actually set up.
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+
+def _score_runs_numpy(scores: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find runs of consecutive frames scoring above threshold.
+    
+    Returns:
+        (run start frames, exclusive run end frames, mean score per run)
+    """
+    mask = scores > threshold
+    if not mask.any():
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0, dtype=np.float64)
+    
+    # Edges of the padded mask alternate between run starts and (exclusive) run ends
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], mask, [False]))))
+    starts, ends = edges[0::2], edges[1::2]
+    
+    # Mean score per run from a prefix sum (runs are never empty)
+    cumulative = np.concatenate(([0.0], np.cumsum(scores, dtype=np.float64)))
+    return starts, ends, (cumulative[ends] - cumulative[starts]) / (ends - starts)
+
+
+def _score_runs_loop(scores: np.ndarray, threshold: float):
+    """Single-pass loop version of _score_runs_numpy, compiled with Numba."""
+    n = scores.shape[0]
+    starts = np.empty(n, dtype=np.int64)
+    ends = np.empty(n, dtype=np.int64)
+    confidences = np.empty(n, dtype=np.float64)
+    count = 0
+    i = 0
+    while i < n:
+        if scores[i] > threshold:
+            j = i
+            total = 0.0
+            while j < n and scores[j] > threshold:
+                total += scores[j]
+                j += 1
+            starts[count] = i
+            ends[count] = j
+            confidences[count] = total / (j - i)
+            count += 1
+            i = j
+        else:
+            i += 1
+    return starts[:count], ends[:count], confidences[:count]
+
+
+def _segment_rms_numpy(audio: np.ndarray, start: int, end: int) -> float:
+    """RMS of audio[start:end] (end > start)."""
+    segment = audio[start:end]
+    return math.sqrt(float(np.dot(segment, segment)) / segment.size)
+
+
+def _segment_rms_loop(audio: np.ndarray, start: int, end: int) -> float:
+    """Loop version of _segment_rms_numpy, compiled with Numba."""
+    total = 0.0
+    for i in range(start, end):
+        total += audio[i] * audio[i]
+    return math.sqrt(total / (end - start))
+
+
+# NumPy versions until warm_up_kernels() swaps in the compiled loops
+score_runs = _score_runs_numpy
+segment_rms = _segment_rms_numpy
+
+
+def warm_up_kernels() -> None:
+    """
+    Compile the Numba kernels for the dtypes used at runtime and switch
+    score_runs/segment_rms over to them (no-op without Numba or when done already).
+    """
+    global score_runs, segment_rms
+    if not NUMBA_AVAILABLE or score_runs is not _score_runs_numpy:
+        return
+    
+    from numba import njit
+    score_runs = njit(cache=True, fastmath=True)(_score_runs_loop)
+    segment_rms = njit(cache=True, fastmath=True)(_segment_rms_loop)
+    score_runs(np.zeros(2, dtype=np.float64), 0.5)
+    segment_rms(np.zeros(2, dtype=np.float32), 0, 2)
+
+
+YAMNET_HUB_URL = 'https://tfhub.dev/google/yamnet/1'
+YAMNET_ONNX_PATH = Path.home() / '.bark_detector' / 'models' / 'yamnet.onnx'
+YAMNET_ONNX_INT8_PATH = YAMNET_ONNX_PATH.with_name('yamnet-int8.onnx')
+YAMNET_CLASS_MAP_NAME = 'yamnet_class_map.csv'
+BARK_CLASS_CACHE_PATH = Path.home() / '.bark_detector' / 'yamnet_bark_indices.json'
+
+
+def export_yamnet_onnx(output_path: Path = YAMNET_ONNX_PATH, quantize: bool = False) -> Path:
+    """
+    Convert the TF-Hub YAMNet model to ONNX for faster CPU inference.
+    
+    Only the per-frame class scores are exported. ONNX drops the SavedModel
+    assets, so the class map CSV is copied next to the model.
+    
+    Args:
+        output_path: Where to write the .onnx file
+        quantize: Also write an int8 dynamically quantized copy
+            (yamnet-int8.onnx), used by detectors created with onnx_int8=True.
+            Without it, an int8 copy left from an earlier export is deleted so
+            it can't fall out of step with the new float model
+        
+    Returns:
+        Path to the exported model (the int8 copy when quantize is set)
+    """
+    try:
+        import tf2onnx
+    except ImportError:
+        raise ImportError("ONNX export requires tf2onnx: uv pip install tf2onnx onnxruntime")
+    import shutil
+    import tensorflow as tf
+    import tensorflow_hub as hub
+    
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    logger.info("Loading YAMNet from TF-Hub for export...")
+    yamnet_model = hub.load(YAMNET_HUB_URL)
+    
+    @tf.function(input_signature=[tf.TensorSpec(shape=[None], dtype=tf.float32, name='waveform')])
+    def yamnet_scores(waveform):
+        scores, embeddings, spectrogram = yamnet_model(waveform)
+        return tf.identity(scores, name='scores')
+    
+    tf2onnx.convert.from_function(
+        yamnet_scores,
+        input_signature=yamnet_scores.input_signature,
+        opset=14,
+        output_path=str(output_path)
+    )
+    
+    class_map_path = yamnet_model.class_map_path().numpy().decode('utf-8')
+    shutil.copyfile(class_map_path, output_path.with_name(YAMNET_CLASS_MAP_NAME))
+    
+    logger.info(f"✅ YAMNet exported to ONNX: {output_path}")
+    
+    if quantize:
+        try:
+            from onnxruntime.quantization import quantize_dynamic, QuantType
+        except ImportError:
+            raise ImportError("int8 quantization requires onnxruntime: uv pip install onnxruntime")
+        
+        int8_path = output_path.with_name(YAMNET_ONNX_INT8_PATH.name)
+        quantize_dynamic(str(output_path), str(int8_path), weight_type=QuantType.QInt8)
+        logger.info(f"✅ Quantized int8 model written: {int8_path}")
+        logger.info("Compare F1 against the float model with --calibrate-files before and "
+                    "after adding --int8, then pass --int8 to run on it")
+        return int8_path
+    
+    stale_int8_path = output_path.with_name(YAMNET_ONNX_INT8_PATH.name)
+    if stale_int8_path.exists():
+        stale_int8_path.unlink()
+        logger.info(f"Removed int8 model from an earlier export: {stale_int8_path}")
+    
+    return output_path
+
+
 class AdvancedBarkDetector:
     """Advanced bark detector using YAMNet with comprehensive analysis."""
     
@@ -1806,8 +2384,17 @@ class AdvancedBarkDetector:
                  quiet_duration: float = 30.0,
                  session_gap_threshold: float = 10.0,
                  output_dir: str = "recordings",
-                 profile_name: str = None):
-        """Initialize the advanced bark detector."""
+                 profile_name: str = None,
+                 load_model: bool = True,
+                 onnx_int8: bool = False):
+        """
+        Initialize the advanced bark detector.
+        
+        Args:
+            load_model: Load YAMNet now; commands that only list, report or
+                convert files pass False to skip the TensorFlow import and model load
+            onnx_int8: Run on the int8 quantized ONNX model instead of the float one
+        """
         self.sensitivity = sensitivity
         self.sample_rate = sample_rate
         self.chunk_size = chunk_size
@@ -1823,6 +2410,10 @@ class AdvancedBarkDetector:
         
         # YAMNet model components
         self.yamnet_model = None
+        self.onnx_session = None  # Used instead of yamnet_model when an exported model exists
+        self.onnx_model_path = None
+        self.onnx_int8 = onnx_int8
+        self._batched_yamnet = None
         self.class_names = None
         self.bark_class_indices = []
         
@@ -1835,21 +2426,41 @@ class AdvancedBarkDetector:
         # Audio processing
         self.is_recording = False
         self.is_running = False
-        self.recording_data = []
+        self.recording_wav = None  # Open WAV the current session streams into
+        self.recording_partial_path: Optional[str] = None
+        self.recorded_samples = 0
+        self.recording_events: List[BarkEvent] = []  # Live detections, recording-relative
+        
+        # Recordings are written and analyzed off the audio callback thread
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='recording-io')
+        self._last_save_future = None
         self.last_bark_time = 0.0
         self.audio = None
         self.stream = None
         self.audio_buffer = []
         
-        # Analysis buffer for event detection
-        self.analysis_buffer = []
+        # Analysis buffer for event detection: preallocated int16 ring holding two
+        # windows, so the latest window is always a contiguous slice ending at
+        # analysis_buffer_pos
         self.detection_buffer_duration = 1.0  # 1 second for analysis
+        self.analysis_window_samples = int(self.detection_buffer_duration * self.sample_rate)
+        
+        # YAMNet needs at least one 0.975s frame; live windows are sized to never need padding
+        self.model_min_samples = int(0.975 * self.sample_rate)
+        if self.analysis_window_samples < self.model_min_samples:
+            raise ValueError("detection_buffer_duration must cover at least one 0.975s YAMNet frame")
+        self.analysis_buffer = np.zeros(2 * self.analysis_window_samples, dtype=np.int16)
+        self.analysis_buffer_pos = 0
+        
+        # Chunks waiting for batched YAMNet inference (~64ms each at 1024 samples)
+        self.inference_batch_size = 4
+        self._pending_chunks = []
         
         # Detection deduplication system
-        self.recent_detections = []  # List of recent detection timestamps
         self.last_reported_bark_time = 0.0  # Last time we reported a bark to console
         self.detection_cooldown_duration = 2.5  # Seconds to wait before reporting another bark
         self.max_recent_detections = 10  # Maximum number of recent detections to track
+        self.recent_detections = deque(maxlen=self.max_recent_detections)  # Recent detection timestamps, oldest first
         
         # Violation detection system
         self.violation_tracker = LegalViolationTracker()
@@ -1858,8 +2469,12 @@ class AdvancedBarkDetector:
         # Create output directory
         os.makedirs(self.output_dir, exist_ok=True)
         
-        # Initialize YAMNet
-        self._load_yamnet_model()
+        if load_model:
+            # Initialize YAMNet
+            self._load_yamnet_model()
+            
+            # Compile the event kernels now so the first detection doesn't pay for it
+            warm_up_kernels()
         
         logger.info(f"Advanced Bark Detector initialized:")
         logger.info(f"  Sensitivity: {sensitivity}")
@@ -1872,17 +2487,98 @@ class AdvancedBarkDetector:
         """Show download progress indicator."""
         print(f"\r{message}", end="", flush=True)
         dot_count = 0
-        while not stop_event.is_set():
-            time.sleep(0.5)
-            if not stop_event.is_set():
-                print(".", end="", flush=True)
-                dot_count += 1
-                if dot_count >= 6:
-                    print(f"\r{message}", end="", flush=True)
-                    dot_count = 0
+        # wait() returns as soon as the event is set, so shutdown isn't delayed
+        while not stop_event.wait(0.5):
+            print(".", end="", flush=True)
+            dot_count += 1
+            if dot_count >= 6:
+                print(f"\r{message}", end="", flush=True)
+                dot_count = 0
+    
+    def _load_onnx_model(self) -> bool:
+        """
+        Load the exported ONNX YAMNet model if it and onnxruntime are available.
+        The int8 quantized model is only used when onnx_int8 is set.
+        
+        Returns:
+            True if the ONNX model is ready for inference
+        """
+        model_path = YAMNET_ONNX_PATH
+        if self.onnx_int8:
+            if YAMNET_ONNX_INT8_PATH.exists():
+                model_path = YAMNET_ONNX_INT8_PATH
+            else:
+                logger.warning(f"int8 model not found ({YAMNET_ONNX_INT8_PATH}); "
+                               "export it with --export-onnx --quantize. Using the float model")
+        class_map_path = YAMNET_ONNX_PATH.with_name(YAMNET_CLASS_MAP_NAME)
+        if not (model_path.exists() and class_map_path.exists()):
+            return False
+        
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            logger.debug("onnxruntime not installed; using TF-Hub YAMNet")
+            return False
+        
+        self.onnx_session = ort.InferenceSession(
+            str(model_path), providers=['CPUExecutionProvider']
+        )
+        self.onnx_model_path = model_path
+        self._onnx_input_name = self.onnx_session.get_inputs()[0].name
+        self._load_bark_classes(str(class_map_path))
+        return True
+    
+    def _load_bark_classes(self, csv_path: str) -> None:
+        """
+        Set class_names and bark_class_indices for the given class map.
+        
+        The result is cached in BARK_CLASS_CACHE_PATH keyed by the class map's
+        path and mtime, so later launches skip the CSV parse and keyword scan.
+        
+        Args:
+            csv_path: Path to the YAMNet class map CSV
+        """
+        try:
+            mtime = os.path.getmtime(csv_path)
+        except OSError:
+            mtime = None
+        
+        if mtime is not None:
+            try:
+                with open(BARK_CLASS_CACHE_PATH, 'r') as f:
+                    cached = json.load(f)
+                if cached.get('csv') == csv_path and cached.get('mtime') == mtime:
+                    self.class_names = cached['names']
+                    self.bark_class_indices = np.asarray(cached['indices'], dtype=np.intp)
+                    logger.debug(f"Loaded bark classes from cache: {BARK_CLASS_CACHE_PATH}")
+                    return
+            except (OSError, ValueError, KeyError, TypeError):
+                pass  # Missing or stale cache; rebuild below
+        
+        self.class_names = self._load_class_names(csv_path.encode('utf-8'))
+        self._find_bark_classes()
+        
+        if mtime is None:
+            return
+        try:
+            BARK_CLASS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(BARK_CLASS_CACHE_PATH, 'w') as f:
+                json.dump({
+                    'csv': csv_path,
+                    'mtime': mtime,
+                    'indices': self.bark_class_indices.tolist(),
+                    'names': self.class_names
+                }, f)
+        except OSError as e:
+            logger.debug(f"Could not write bark class cache: {e}")
     
     def _load_yamnet_model(self) -> None:
         """Load YAMNet model with advanced class detection."""
+        if self._load_onnx_model():
+            logger.info(f"YAMNet ONNX model loaded from {self.onnx_model_path}")
+            logger.info(f"Found {len(self.bark_class_indices)} bark-related classes")
+            return
+        
         try:
             logger.info("Downloading YAMNet model (this may take a few minutes on first run)...")
             
@@ -1895,8 +2591,9 @@ class AdvancedBarkDetector:
             progress_thread.daemon = True
             progress_thread.start()
             
-            # Load YAMNet model
-            self.yamnet_model = hub.load('https://tfhub.dev/google/yamnet/1')
+            # Load YAMNet model (TensorFlow is only imported once a detector is built)
+            import tensorflow_hub as hub
+            self.yamnet_model = hub.load(YAMNET_HUB_URL)
             
             # Stop progress indicator
             stop_event.set()
@@ -1906,12 +2603,9 @@ class AdvancedBarkDetector:
             logger.info("YAMNet model downloaded successfully!")
             logger.info("Loading class names...")
             
-            # Load class names using model's built-in method
+            # Load class names and bark classes (cached after the first run)
             class_map_path = self.yamnet_model.class_map_path().numpy()
-            self.class_names = self._load_class_names(class_map_path)
-            
-            # Find bark-related classes
-            self._find_bark_classes()
+            self._load_bark_classes(class_map_path.decode('utf-8'))
             
             logger.info(f"YAMNet model loaded successfully!")
             logger.info(f"Model supports {len(self.class_names)} audio classes")
@@ -1927,22 +2621,20 @@ class AdvancedBarkDetector:
             csv_file_path = class_map_path.decode('utf-8')
             logger.debug(f"Loading class names from: {csv_file_path}")
             
-            with open(csv_file_path, 'r') as f:
-                content = f.read()
-            
             class_names = []
-            reader = csv.reader(io.StringIO(content))
-            rows = list(reader)
-            
-            # Skip header row if present
-            if rows and rows[0] and rows[0][0] == 'index':
-                rows = rows[1:]
-            
-            for row in rows:
-                if len(row) >= 3:
-                    class_names.append(row[2])  # Display name
-                else:
-                    logger.warning(f"Unexpected row format: {row}")
+            with open(csv_file_path, 'r', newline='') as f:
+                reader = csv.reader(f)
+                
+                # Skip header row if present
+                first_row = next(reader, None)
+                if first_row is not None and first_row[:1] != ['index']:
+                    reader = chain([first_row], reader)
+                
+                for row in reader:
+                    if len(row) >= 3:
+                        class_names.append(row[2])  # Display name
+                    else:
+                        logger.warning(f"Unexpected row format: {row}")
             
             logger.debug(f"Loaded {len(class_names)} class names")
             return class_names
@@ -1958,38 +2650,35 @@ class AdvancedBarkDetector:
             'whimper', 'howl', 'growl', 'animal'
         ]
         
-        self.bark_class_indices = []
         logger.debug(f"Searching through {len(self.class_names)} classes for bark-related sounds")
         
-        for i, class_name in enumerate(self.class_names):
-            if any(keyword.lower() in class_name.lower() for keyword in bark_keywords):
-                self.bark_class_indices.append(i)
-                logger.debug(f"Found bark-related class: {i} - {class_name}")
+        # Lowercase all names once, then one vectorized substring test per keyword
+        names = np.char.lower(np.asarray(self.class_names, dtype=str))
+        hits = np.zeros(len(names), dtype=bool)
+        for keyword in bark_keywords:
+            hits |= np.char.find(names, keyword) >= 0
+        
+        # Index array so _get_bark_scores can fancy-index the score matrix directly
+        self.bark_class_indices = np.flatnonzero(hits).astype(np.intp)
+        
+        for i in self.bark_class_indices:
+            logger.debug(f"Found bark-related class: {i} - {self.class_names[i]}")
         
         if len(self.bark_class_indices) == 0:
             logger.warning("No bark-related classes found in YAMNet model")
     
     def _detect_barks_in_buffer(self, audio_chunk: np.ndarray) -> List[BarkEvent]:
         """Detect barks in audio buffer using YAMNet."""
+        return self._detect_barks_in_buffer_with_sensitivity(audio_chunk, self.sensitivity)
+    
+    def _detect_barks_in_buffer_with_sensitivity(self, audio_chunk: np.ndarray, sensitivity: float) -> List[BarkEvent]:
+        """Detect barks in audio buffer using YAMNet with an explicit sensitivity threshold."""
         try:
-            # Normalize audio to [-1, 1] range
-            waveform = audio_chunk.astype(np.float32)
-            if np.max(np.abs(waveform)) > 0:
-                waveform = waveform / np.max(np.abs(waveform))
-            
-            # Ensure minimum length for YAMNet
-            min_samples = int(0.975 * self.sample_rate)
-            if len(waveform) < min_samples:
-                waveform = np.pad(waveform, (0, min_samples - len(waveform)))
-            
-            # Run YAMNet inference
-            scores, embeddings, spectrogram = self.yamnet_model(waveform)
-            
-            # Get bark-related scores
-            bark_scores = self._get_bark_scores(scores.numpy())
+            # Run YAMNet and reduce to per-frame bark scores
+            bark_scores = self._score_buffer(audio_chunk)
             
             # Convert scores to events
-            bark_events = self._scores_to_events(bark_scores)
+            bark_events = self._scores_to_events_with_sensitivity(bark_scores, sensitivity)
             
             return bark_events
             
@@ -1997,91 +2686,180 @@ class AdvancedBarkDetector:
             logger.error(f"Error in bark detection: {e}")
             return []
     
+    def _detect_barks_in_windows(self, windows: List[np.ndarray]) -> List[List[BarkEvent]]:
+        """Detect barks in several equal-length analysis windows with one model call."""
+        if not windows:
+            return []
+        
+        try:
+            return [self._scores_to_events(bark_scores)
+                    for bark_scores in self._score_windows(np.stack(windows))]
+        except Exception as e:
+            logger.error(f"Error in bark detection: {e}")
+            return [[] for _ in windows]
+    
+    def _score_windows(self, waveforms: np.ndarray) -> List[np.ndarray]:
+        """
+        Batched counterpart of _score_buffer for a [windows, samples] array.
+        
+        YAMNet only takes a single waveform, so the TF model is mapped over
+        the batch inside one traced graph call.
+        """
+        # Normalize each window to [-1, 1] range
+        waveforms = waveforms.astype(np.float32, copy=False)
+        peaks = np.max(np.abs(waveforms), axis=1, keepdims=True)
+        waveforms = waveforms / np.where(peaks > 0, peaks, np.float32(1.0))
+        
+        # Live analysis windows are always long enough for YAMNet (checked in __init__)
+        assert waveforms.shape[1] >= self.model_min_samples
+        
+        if self.onnx_session is not None:
+            # Rows of the C-ordered float32 batch go to ORT without a copy
+            return [
+                self._get_bark_scores(self.onnx_session.run(None, {self._onnx_input_name: waveform})[0])
+                for waveform in np.ascontiguousarray(waveforms)
+            ]
+        
+        if self._batched_yamnet is None:
+            self._batched_yamnet = self._build_batched_yamnet()
+        scores = self._batched_yamnet(waveforms).numpy()
+        return [self._get_bark_scores(window_scores) for window_scores in scores]
+    
+    def _build_batched_yamnet(self):
+        """Trace a graph that runs YAMNet over each row of a waveform batch."""
+        import tensorflow as tf
+        yamnet_model = self.yamnet_model
+        
+        @tf.function(input_signature=[tf.TensorSpec(shape=[None, None], dtype=tf.float32)])
+        def batched_scores(waveforms):
+            return tf.map_fn(lambda waveform: yamnet_model(waveform)[0], waveforms,
+                             fn_output_signature=tf.float32)
+        
+        return batched_scores
+    
+    def _score_buffer(self, audio_chunk: np.ndarray) -> np.ndarray:
+        """
+        Run YAMNet on an audio buffer and return per-frame bark scores.
+        Scores do not depend on sensitivity, so callers that try several
+        thresholds can score once and re-threshold with
+        _scores_to_events_with_sensitivity.
+        """
+        # Normalize audio to [-1, 1] range
+        waveform = audio_chunk.astype(np.float32)
+        peak = np.max(np.abs(waveform)) if len(waveform) else 0.0
+        if peak > 0:
+            waveform = waveform / peak
+        
+        # Ensure minimum length for YAMNet (only short files or clips get here;
+        # calibration scores files concurrently, so no shared pad buffer)
+        if len(waveform) < self.model_min_samples:
+            waveform = np.pad(waveform, (0, self.model_min_samples - len(waveform)))
+        
+        # Single YAMNet call over the whole buffer; the model frames it internally
+        if self.onnx_session is not None:
+            scores = self.onnx_session.run(None, {self._onnx_input_name: waveform})[0]
+        else:
+            scores, embeddings, spectrogram = self.yamnet_model(waveform)
+            scores = scores.numpy()
+        
+        # Get bark-related scores
+        return self._get_bark_scores(scores)
+    
     def _get_bark_scores(self, scores: np.ndarray) -> np.ndarray:
         """Extract bark-related confidence scores."""
         if len(self.bark_class_indices) == 0:
             return np.zeros(scores.shape[0])
         
-        # Get scores for bark-related classes
-        bark_class_scores = scores[:, self.bark_class_indices]
-        
-        # Take maximum score across all bark classes for each time frame
-        bark_scores = np.max(bark_class_scores, axis=1)
-        
-        return bark_scores
+        # Maximum score across the bark-related classes for each time frame.
+        # The result gets a fresh array rather than a shared output buffer:
+        # calibration caches per-file scores and scores files concurrently.
+        return scores.take(self.bark_class_indices, axis=1).max(axis=1)
     
     def _scores_to_events(self, bark_scores: np.ndarray) -> List[BarkEvent]:
         """Convert YAMNet scores to bark events."""
+        return self._scores_to_events_with_sensitivity(bark_scores, self.sensitivity)
+    
+    def _scores_to_events_with_sensitivity(self, bark_scores: np.ndarray, sensitivity: float) -> List[BarkEvent]:
+        """Convert YAMNet scores to bark events using an explicit sensitivity threshold."""
         # YAMNet produces one prediction every 0.48 seconds
         time_per_frame = 0.48
         
-        # Find frames above threshold
-        bark_frames = np.where(bark_scores > self.sensitivity)[0]
-        
-        if len(bark_frames) == 0:
+        # Runs of consecutive frames above threshold
+        starts, ends, confidences = score_runs(
+            np.ascontiguousarray(bark_scores, dtype=np.float64), float(sensitivity)
+        )
+        if len(starts) == 0:
             return []
         
-        # Group consecutive frames into events
-        events = []
-        current_start = bark_frames[0]
-        current_end = bark_frames[0]
-        
-        for i in range(1, len(bark_frames)):
-            if bark_frames[i] == current_end + 1:
-                current_end = bark_frames[i]
-            else:
-                # Create event from current group
-                start_time = current_start * time_per_frame
-                end_time = (current_end + 1) * time_per_frame
-                confidence = np.mean(bark_scores[current_start:current_end + 1])
-                
-                events.append(BarkEvent(
-                    start_time=start_time,
-                    end_time=end_time,
-                    confidence=confidence
-                ))
-                
-                current_start = bark_frames[i]
-                current_end = bark_frames[i]
-        
-        # Add final event
-        start_time = current_start * time_per_frame
-        end_time = (current_end + 1) * time_per_frame
-        confidence = np.mean(bark_scores[current_start:current_end + 1])
-        
-        events.append(BarkEvent(
-            start_time=start_time,
-            end_time=end_time,
-            confidence=confidence
-        ))
-        
-        return events
+        return [
+            BarkEvent(start_time=start_time, end_time=end_time, confidence=confidence)
+            for start_time, end_time, confidence in zip(
+                (starts * time_per_frame).tolist(),
+                (ends * time_per_frame).tolist(),
+                confidences.tolist()
+            )
+        ]
     
-    def _calculate_event_intensity(self, audio_data: np.ndarray, event: BarkEvent) -> float:
-        """Calculate intensity for a bark event."""
-        try:
-            start_sample = int(event.start_time * self.sample_rate)
-            end_sample = int(event.end_time * self.sample_rate)
+    def _calculate_event_intensity(self, audio_data: np.ndarray, start_sample: int,
+                                   end_sample: int, confidence: float) -> float:
+        """
+        Calculate intensity for a bark event spanning audio_data[start_sample:end_sample].
+        
+        Args:
+            audio_data: Float audio the event was detected in
+            start_sample: First sample of the event
+            end_sample: Exclusive end sample of the event
+            confidence: Detection confidence of the event
             
+        Returns:
+            Intensity in [0, 1]
+        """
+        try:
             if start_sample >= len(audio_data) or end_sample > len(audio_data):
-                return event.confidence * 0.5  # Fallback to confidence-based intensity
-            
-            event_audio = audio_data[start_sample:end_sample]
+                return confidence * 0.5  # Fallback to confidence-based intensity
             
-            if len(event_audio) == 0:
-                return event.confidence * 0.5
+            if end_sample <= start_sample:
+                return confidence * 0.5
             
             # Calculate RMS volume
-            rms = np.sqrt(np.mean(event_audio ** 2))
-            volume_intensity = min(1.0, rms * 10)  # Scale RMS to reasonable range
-            
-            # Combine volume and confidence
-            intensity = 0.6 * volume_intensity + 0.4 * event.confidence
-            return min(1.0, max(0.0, intensity))
+            rms = segment_rms(audio_data, start_sample, end_sample)
+            return self._intensity_from_rms(rms, confidence)
             
         except Exception as e:
             logger.warning(f"Error calculating event intensity: {e}")
-            return event.confidence * 0.5
+            return confidence * 0.5
+    
+    @staticmethod
+    def _intensity_from_rms(rms: float, confidence: float) -> float:
+        """Blend an event's RMS volume with its detection confidence."""
+        volume_intensity = min(1.0, rms * 10)  # Scale RMS to reasonable range
+        
+        # Combine volume and confidence
+        intensity = 0.6 * volume_intensity + 0.4 * confidence
+        return min(1.0, max(0.0, intensity))
+    
+    def _calculate_event_intensities(self, audio_data: np.ndarray, events: List[BarkEvent]) -> None:
+        """
+        Set intensity on many events from one recording.
+        
+        Same result as _calculate_event_intensity per event, but each RMS is
+        read in O(1) from a prefix sum of squared samples computed once.
+        """
+        cumulative_squares = np.concatenate((
+            [0.0], np.cumsum(np.square(audio_data, dtype=np.float32), dtype=np.float64)
+        ))
+        
+        for event in events:
+            start_sample = int(event.start_time * self.sample_rate)
+            end_sample = int(event.end_time * self.sample_rate)
+            
+            if start_sample >= len(audio_data) or end_sample > len(audio_data) or end_sample <= start_sample:
+                event.intensity = event.confidence * 0.5  # Fallback to confidence-based intensity
+                continue
+            
+            sum_squares = max(0.0, float(cumulative_squares[end_sample] - cumulative_squares[start_sample]))
+            rms = math.sqrt(sum_squares / (end_sample - start_sample))
+            event.intensity = self._intensity_from_rms(rms, event.confidence)
     
     def _group_events_into_sessions(self, events: List[BarkEvent]) -> List[BarkingSession]:
         """Group bark events into sessions."""
@@ -2089,65 +2867,87 @@ class AdvancedBarkDetector:
             return []
         
         # Sort events by start time
-        sorted_events = sorted(events, key=lambda x: x.start_time)
+        sorted_events = sort_by_start_time(events)
         
-        sessions = []
-        current_session_events = [sorted_events[0]]
+        # A new session starts wherever the gap to the previous event exceeds the threshold
+        starts = np.fromiter((e.start_time for e in sorted_events), dtype=np.float64, count=len(sorted_events))
+        ends = np.fromiter((e.end_time for e in sorted_events), dtype=np.float64, count=len(sorted_events))
+        gaps = starts[1:] - ends[:-1]
+        boundaries = np.concatenate(([0], np.flatnonzero(gaps > self.session_gap_threshold) + 1))
         
-        for i in range(1, len(sorted_events)):
-            current_event = sorted_events[i]
-            last_event = current_session_events[-1]
-            
-            # Check gap between events
-            gap = current_event.start_time - last_event.end_time
-            
-            if gap <= self.session_gap_threshold:
-                current_session_events.append(current_event)
-            else:
-                # Create session and start new one
-                session = self._create_session(current_session_events)
-                sessions.append(session)
-                current_session_events = [current_event]
-        
-        # Add final session
-        if current_session_events:
-            session = self._create_session(current_session_events)
-            sessions.append(session)
-        
-        return sessions
+        return self._create_sessions(sorted_events, boundaries)
     
     def _create_session(self, events: List[BarkEvent]) -> BarkingSession:
         """Create a barking session from events."""
-        start_time = min(event.start_time for event in events)
-        end_time = max(event.end_time for event in events)
-        total_duration = sum(event.end_time - event.start_time for event in events)
-        session_duration = end_time - start_time
-        
-        confidences = [event.confidence for event in events]
-        avg_confidence = np.mean(confidences)
-        peak_confidence = np.max(confidences)
-        
-        barks_per_second = len(events) / session_duration if session_duration > 0 else 0
+        return self._create_sessions(events, np.zeros(1, dtype=np.intp))[0]
+    
+    def _create_sessions(self, events: List[BarkEvent], boundaries: np.ndarray) -> List[BarkingSession]:
+        """
+        Create barking sessions from consecutive runs of events.
         
-        # Calculate session intensity
-        intensities = [event.intensity for event in events if event.intensity > 0]
-        avg_intensity = np.mean(intensities) if intensities else avg_confidence
+        Per-session aggregates are computed for all sessions at once with
+        ufunc reduceat over struct-of-arrays columns.
         
-        return BarkingSession(
-            start_time=start_time,
-            end_time=end_time,
-            events=events,
-            total_barks=len(events),
-            total_duration=total_duration,
-            avg_confidence=avg_confidence,
-            peak_confidence=peak_confidence,
-            barks_per_second=barks_per_second,
-            intensity=avg_intensity
-        )
+        Args:
+            events: Events, grouped so each session is a contiguous run
+            boundaries: Index of the first event of each session (starting at 0)
+        """
+        n = len(events)
+        starts = np.fromiter((e.start_time for e in events), dtype=np.float64, count=n)
+        ends = np.fromiter((e.end_time for e in events), dtype=np.float64, count=n)
+        confidences = np.fromiter((e.confidence for e in events), dtype=np.float64, count=n)
+        intensities = np.fromiter((e.intensity for e in events), dtype=np.float64, count=n)
+        
+        counts = np.diff(np.append(boundaries, n))
+        session_starts = np.minimum.reduceat(starts, boundaries)
+        session_ends = np.maximum.reduceat(ends, boundaries)
+        total_durations = np.add.reduceat(ends - starts, boundaries)
+        session_durations = session_ends - session_starts
+        
+        avg_confidences = np.add.reduceat(confidences, boundaries) / counts
+        peak_confidences = np.maximum.reduceat(confidences, boundaries)
+        
+        barks_per_second = np.divide(counts, session_durations,
+                                     out=np.zeros(len(counts)), where=session_durations > 0)
+        
+        # Session intensity averages the measured (non-zero) intensities,
+        # falling back to the average confidence when none were measured
+        measured = intensities > 0
+        measured_counts = np.add.reduceat(measured.astype(np.int64), boundaries)
+        measured_sums = np.add.reduceat(np.where(measured, intensities, 0.0), boundaries)
+        avg_intensities = np.where(measured_counts > 0,
+                                   measured_sums / np.maximum(measured_counts, 1),
+                                   avg_confidences)
+        
+        bounds = np.append(boundaries, n).tolist()
+        return [
+            BarkingSession(
+                start_time=start_time,
+                end_time=end_time,
+                events=events[bounds[k]:bounds[k + 1]],
+                total_barks=total_barks,
+                total_duration=total_duration,
+                avg_confidence=avg_confidence,
+                peak_confidence=peak_confidence,
+                barks_per_second=rate,
+                intensity=intensity
+            )
+            for k, (start_time, end_time, total_barks, total_duration, avg_confidence,
+                    peak_confidence, rate, intensity) in enumerate(zip(
+                session_starts.tolist(), session_ends.tolist(), counts.tolist(),
+                total_durations.tolist(), avg_confidences.tolist(),
+                peak_confidences.tolist(), barks_per_second.tolist(), avg_intensities.tolist()
+            ))
+        ]
     
     def save_recording(self) -> str:
-        """Save recording with comprehensive analysis."""
-        if not self.recording_data:
+        """
+        Save recording with comprehensive analysis.
+        
+        The WAV write and analysis run on a background thread so the audio
+        callback is not blocked; the returned path is final immediately.
+        """
+        if self.recording_wav is None:
             return ""
         
         # Generate timestamp and extract date
@@ -2162,42 +2962,94 @@ class AdvancedBarkDetector:
         filename = f"bark_recording_{timestamp}.wav"
         filepath = os.path.join(date_dir, filename)
         
-        # Convert recording data
-        audio_data = np.concatenate(self.recording_data)
-        
-        # Save WAV file
-        with wave.open(filepath, 'wb') as wav_file:
-            wav_file.setnchannels(self.channels)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(self.sample_rate)
-            wav_file.writeframes(audio_data.tobytes())
-        
-        # Analyze the complete recording
-        self._analyze_complete_recording(audio_data, filepath)
-        
-        duration = len(audio_data) / self.sample_rate
-        logger.info(f"Recording saved: {filepath} (Duration: {duration:.1f}s)")
+        # Hand the finished session to the I/O thread; the next session starts fresh
+        wav_file, self.recording_wav = self.recording_wav, None
+        recording_events, self.recording_events = self.recording_events, []
+        self._last_save_future = self._io_pool.submit(
+            self._save_recording_worker, wav_file, self.recording_partial_path,
+            recording_events, filepath
+        )
+        self.recording_partial_path = None
         
         return filepath
     
-    def _analyze_complete_recording(self, audio_data: np.ndarray, filepath: str):
-        """Perform comprehensive analysis of the complete recording."""
+    def _open_recording_file(self) -> None:
+        """Open a partial WAV file that the new session's audio is streamed into."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.recording_partial_path = os.path.join(
+            self.output_dir, f".bark_recording_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.wav.part"
+        )
+        self.recording_wav = wave.open(self.recording_partial_path, 'wb')
+        self.recording_wav.setnchannels(self.channels)
+        self.recording_wav.setsampwidth(2)
+        self.recording_wav.setframerate(self.sample_rate)
+    
+    def _save_recording_worker(self, wav_file, partial_path: str,
+                               recording_events: List[BarkEvent], filepath: str) -> None:
+        """Finalize a streamed recording and analyze it (runs on the I/O thread)."""
+        try:
+            # Fix up the WAV header and move the file into place
+            wav_file.close()
+            os.replace(partial_path, filepath)
+            
+            # Read the samples back for intensity analysis
+            audio_data, _ = sf.read(filepath, dtype='int16')
+            
+            # Analyze the complete recording from the detections made while recording
+            self._analyze_complete_recording(audio_data, filepath,
+                                             self._merge_recording_events(recording_events))
+            
+            duration = len(audio_data) / self.sample_rate
+            logger.info(f"Recording saved: {filepath} (Duration: {duration:.1f}s)")
+            
+        except Exception as e:
+            logger.error(f"Error saving recording {filepath}: {e}")
+    
+    def _merge_recording_events(self, events: List[BarkEvent]) -> List[BarkEvent]:
+        """
+        Merge live detections into distinct bark events.
+        
+        The live analysis window slides by one chunk at a time, so the same
+        bark is reported by many overlapping windows; overlapping detections
+        are merged and keep their highest confidence.
+        """
+        merged = []
+        for event in sort_by_start_time(events):
+            if merged and event.start_time < merged[-1].end_time:
+                previous = merged[-1]
+                previous.end_time = max(previous.end_time, event.end_time)
+                previous.confidence = max(previous.confidence, event.confidence)
+                continue
+            merged.append(BarkEvent(event.start_time, event.end_time, event.confidence))
+        return merged
+    
+    def _analyze_complete_recording(self, audio_data: np.ndarray, filepath: str,
+                                    bark_events: Optional[List[BarkEvent]] = None):
+        """
+        Perform comprehensive analysis of the complete recording.
+        
+        Args:
+            audio_data: int16 samples of the saved recording
+            filepath: Path the recording was saved to
+            bark_events: Recording-relative events already detected live;
+                the recording is re-run through YAMNet only when None
+        """
         try:
             logger.info("Analyzing complete recording...")
             
             # Convert to float and normalize
-            audio_float = audio_data.astype(np.float32) / 32768.0
+            audio_float = np.multiply(audio_data, INT16_SCALE, dtype=np.float32)
             
             # Detect all barks in the recording
-            bark_events = self._detect_barks_in_buffer(audio_float)
+            if bark_events is None:
+                bark_events = self._detect_barks_in_buffer(audio_float)
             
             if not bark_events:
                 logger.info("No barks detected in final analysis")
                 return
             
             # Calculate intensities for events
-            for event in bark_events:
-                event.intensity = self._calculate_event_intensity(audio_float, event)
+            self._calculate_event_intensities(audio_float, bark_events)
             
             # Group into sessions
             sessions = self._group_events_into_sessions(bark_events)
@@ -2263,59 +3115,112 @@ class AdvancedBarkDetector:
         Returns:
             True if this detection should be reported, False if it's likely a duplicate
         """
-        # Clean up old detections from tracking list
+        # Clean up old detections from the front (timestamps arrive in order;
+        # the deque's maxlen drops the oldest once it is full)
         cutoff_time = current_time - self.detection_cooldown_duration * 2
-        self.recent_detections = [t for t in self.recent_detections if t > cutoff_time]
+        while self.recent_detections and self.recent_detections[0] <= cutoff_time:
+            self.recent_detections.popleft()
         
         # Check if we're still in cooldown period from last reported bark
         if current_time - self.last_reported_bark_time < self.detection_cooldown_duration:
             # Add to recent detections but don't report
             self.recent_detections.append(current_time)
-            # Trim list size
-            if len(self.recent_detections) > self.max_recent_detections:
-                self.recent_detections = self.recent_detections[-self.max_recent_detections:]
             return False
         
         # This is a new bark - should be reported
         self.recent_detections.append(current_time)
         self.last_reported_bark_time = current_time
         
-        # Trim list size
-        if len(self.recent_detections) > self.max_recent_detections:
-            self.recent_detections = self.recent_detections[-self.max_recent_detections:]
-        
         return True
     
     def process_audio_chunk(self, audio_data: np.ndarray) -> None:
-        """Process audio chunk with advanced bark detection."""
+        """
+        Process audio chunk with advanced bark detection.
+        
+        Chunks are queued and their analysis windows scored by YAMNet in
+        batches of inference_batch_size, then handled in arrival order.
+        """
         current_time = time.time()
         
-        # Add to analysis buffer
-        self.analysis_buffer.extend(audio_data.astype(np.float32) / 32768.0)
+        # Add to analysis buffer, kept as int16 until the model needs it
+        self._append_to_analysis_buffer(audio_data)
+        
+        # Queue the analysis window ending with this chunk once there is enough data
+        buffer_samples = self.analysis_window_samples
+        analysis_chunk = None
+        if self.analysis_buffer_pos >= buffer_samples:
+            # float32 only for the window being scored; cast and scale in one pass.
+            # Each queued window needs its own array until the batch is scored.
+            window = self.analysis_buffer[self.analysis_buffer_pos - buffer_samples:self.analysis_buffer_pos]
+            analysis_chunk = np.multiply(window, INT16_SCALE, dtype=np.float32)
+        
+        self._pending_chunks.append((current_time, audio_data, analysis_chunk))
+        if len(self._pending_chunks) >= self.inference_batch_size:
+            self._flush_pending_chunks()
+    
+    def _append_to_analysis_buffer(self, audio_data: np.ndarray) -> None:
+        """Write a chunk into the analysis ring buffer without reallocating it."""
+        window_samples = self.analysis_window_samples
+        if len(audio_data) >= window_samples:
+            self.analysis_buffer[:window_samples] = audio_data[-window_samples:]
+            self.analysis_buffer_pos = window_samples
+            return
         
-        # Process when we have enough data for analysis
-        buffer_samples = int(self.detection_buffer_duration * self.sample_rate)
-        if len(self.analysis_buffer) >= buffer_samples:
-            # Analyze the buffer
-            analysis_chunk = np.array(self.analysis_buffer[-buffer_samples:])
-            
-            # Detect barks
-            bark_events = self._detect_barks_in_buffer(analysis_chunk)
-            
+        end = self.analysis_buffer_pos + len(audio_data)
+        if end > len(self.analysis_buffer):
+            # Out of room: slide the most recent window back to the front
+            keep = min(self.analysis_buffer_pos, window_samples)
+            self.analysis_buffer[:keep] = self.analysis_buffer[self.analysis_buffer_pos - keep:self.analysis_buffer_pos]
+            self.analysis_buffer_pos = keep
+            end = keep + len(audio_data)
+        
+        self.analysis_buffer[self.analysis_buffer_pos:end] = audio_data
+        self.analysis_buffer_pos = end
+    
+    def _flush_pending_chunks(self) -> None:
+        """Score all queued analysis windows in one model call and handle their chunks."""
+        pending, self._pending_chunks = self._pending_chunks, []
+        if not pending:
+            return
+        
+        windows = [analysis_chunk for _, _, analysis_chunk in pending if analysis_chunk is not None]
+        window_events = iter(self._detect_barks_in_windows(windows))
+        
+        for current_time, audio_data, analysis_chunk in pending:
+            bark_events = next(window_events) if analysis_chunk is not None else []
+            self._handle_audio_chunk(current_time, audio_data, analysis_chunk, bark_events)
+    
+    def _handle_audio_chunk(self, current_time: float, audio_data: np.ndarray,
+                            analysis_chunk: Optional[np.ndarray], bark_events: List[BarkEvent]) -> None:
+        """
+        Apply one chunk's detections and recording state.
+        
+        Args:
+            current_time: Wall-clock time the chunk arrived
+            audio_data: Raw int16 chunk from the audio stream
+            analysis_chunk: Analysis window ending with this chunk (None until the buffer fills)
+            bark_events: Window-relative events detected in analysis_chunk
+        """
+        buffer_samples = self.analysis_window_samples
+        
+        if analysis_chunk is not None:
             # Process any detected barks
+            window_start_time = current_time - self.detection_buffer_duration
             for event in bark_events:
-                # Adjust timing to current time
-                event.start_time = current_time - self.detection_buffer_duration + event.start_time
-                event.end_time = current_time - self.detection_buffer_duration + event.end_time
+                # Calculate intensity while the times are still window-relative
+                event.intensity = self._calculate_event_intensity(
+                    analysis_chunk,
+                    int(event.start_time * self.sample_rate),
+                    int(event.end_time * self.sample_rate),
+                    event.confidence
+                )
                 
-                # Calculate intensity
-                event.intensity = self._calculate_event_intensity(analysis_chunk, 
-                    BarkEvent(event.start_time - (current_time - self.detection_buffer_duration), 
-                             event.end_time - (current_time - self.detection_buffer_duration), 
-                             event.confidence))
+                # Adjust timing to current time
+                event.start_time = window_start_time + event.start_time
+                event.end_time = window_start_time + event.end_time
                 
                 self.last_bark_time = current_time
-                bark_time = datetime.now()
+                bark_time = datetime.fromtimestamp(current_time)
                 
                 # Check if this detection should be reported (deduplication)
                 should_report = self._should_report_detection(current_time, event)
@@ -2335,7 +3240,9 @@ class AdvancedBarkDetector:
                     if should_report:
                         logger.info("Starting recording session...")
                     self.is_recording = True
-                    self.recording_data = []
+                    self._open_recording_file()
+                    self.recorded_samples = 0
+                    self.recording_events = []
                     self.session_start_time = bark_time
                     self.session_bark_count = 0
                 
@@ -2347,14 +3254,25 @@ class AdvancedBarkDetector:
                     'duration': event.end_time - event.start_time
                 })
                 self.session_bark_count += 1
-            
-            # Manage buffer size
-            if len(self.analysis_buffer) > buffer_samples * 2:
-                self.analysis_buffer = self.analysis_buffer[-buffer_samples:]
+                
+                # Keep the detection in recording time so the saved recording
+                # doesn't have to be run through YAMNet again. The window ends
+                # with this chunk, which is appended to the recording below.
+                window_offset = (self.recorded_samples + len(audio_data) - buffer_samples) / self.sample_rate
+                window_start = current_time - self.detection_buffer_duration
+                self.recording_events.append(BarkEvent(
+                    start_time=max(0.0, window_offset + event.start_time - window_start),
+                    end_time=max(0.0, window_offset + event.end_time - window_start),
+                    confidence=event.confidence
+                ))
         
-        # Handle recording state
+        # Handle recording state. The handle is only swapped on this thread once the
+        # stream is stopped (see stop()); save_recording() hands the file to the I/O
+        # worker and clears it, so skip the write rather than touch a handed-off file
         if self.is_recording:
-            self.recording_data.append(audio_data)
+            if self.recording_wav is not None:
+                self.recording_wav.writeframesraw(audio_data.astype(np.int16, copy=False).tobytes())
+            self.recorded_samples += len(audio_data)
             
             # Check for quiet period
             if current_time - self.last_bark_time > self.quiet_duration:
@@ -2362,17 +3280,21 @@ class AdvancedBarkDetector:
                 self.save_recording()
                 self._log_session_summary()
                 self.is_recording = False
-                self.recording_data = []
     
     def audio_callback(self, in_data, frame_count, time_info, status):
         """Audio stream callback."""
+        # stop() is flushing on the main thread: drop the chunk rather than queue
+        # or handle it concurrently, and let PortAudio wind the stream down
+        if not self.is_running:
+            return (in_data, self._pa_complete)
+        
         if status:
             logger.warning(f"Audio callback status: {status}")
         
         audio_data = np.frombuffer(in_data, dtype=np.int16)
         self.process_audio_chunk(audio_data)
         
-        return (in_data, pyaudio.paContinue)
+        return (in_data, self._pa_continue)
     
     def start(self) -> None:
         """Start the advanced bark detector."""
@@ -2383,6 +3305,10 @@ class AdvancedBarkDetector:
         logger.info("Starting Advanced YAMNet Bark Detector...")
         
         try:
+            import pyaudio
+            # Callback return codes, kept so the real-time callback never imports
+            self._pa_continue = pyaudio.paContinue
+            self._pa_complete = pyaudio.paComplete
             self.audio = pyaudio.PyAudio()
             
             self.stream = self.audio.open(
@@ -2413,12 +3339,25 @@ class AdvancedBarkDetector:
         logger.info("Stopping bark detector...")
         self.is_running = False
         
+        # Stop the stream before touching session state: stop_stream() waits for any
+        # callback in progress, so no new chunk can open, write or swap the recording
+        # file while it is flushed and saved below
+        if self.stream and self.stream.is_active():
+            self.stream.stop_stream()
+        
+        # Handle chunks still waiting for inference
+        self._flush_pending_chunks()
+        
         if self.is_recording:
             logger.info("Saving final recording...")
             self.save_recording()
             self._log_session_summary()
             self.is_recording = False
         
+        # Let background saves finish (single worker, so the last one finishes last)
+        if self._last_save_future is not None:
+            self._last_save_future.result()
+        
         self.cleanup()
         logger.info("Bark detector stopped.")
     
@@ -2626,6 +3565,9 @@ Examples:
   uv run bd.py --list-profiles                   # Show available profiles
   uv run bd.py --list-convertible ~/Downloads    # Find Voice Memo files
   uv run bd.py --record bark_sample.wav          # Record calibration sample
+  uv run bd.py --export-onnx                     # Faster inference (needs tf2onnx + onnxruntime)
+  uv run bd.py --export-onnx --quantize          # Also write an int8 model (check F1 with --calibrate-files)
+  uv run bd.py --int8                            # Monitor using the int8 model
   
   # Violation analysis
   uv run bd.py --analyze-violations 2025-08-03   # Analyze recordings for specific date
@@ -2770,6 +3712,26 @@ Examples:
         help='Number of steps in sensitivity sweep (default: 20)'
     )
     
+    parser.add_argument(
+        '--export-onnx',
+        action='store_true',
+        help=f'Export YAMNet to ONNX for faster CPU inference (saved to {YAMNET_ONNX_PATH})'
+    )
+    
+    parser.add_argument(
+        '--quantize',
+        action='store_true',
+        help=f'With --export-onnx, also write an int8 quantized model ({YAMNET_ONNX_INT8_PATH.name}); '
+             'use it with --int8'
+    )
+    
+    parser.add_argument(
+        '--int8',
+        action='store_true',
+        help=f'Run inference on the int8 quantized ONNX model ({YAMNET_ONNX_INT8_PATH.name}) '
+             'instead of the float one'
+    )
+    
     # Detection parameters
     parser.add_argument(
         '--sensitivity', 
@@ -2785,230 +3747,350 @@ Examples:
         help='Output directory for recordings (default: recordings)'
     )
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.quantize and not args.export_onnx:
+        parser.error('--quantize only applies together with --export-onnx')
+    
+    return args
 
 
-def main():
-    """Main function with command line support."""
-    args = parse_arguments()
-    
-    logger.info("=" * 70)
-    logger.info("Advanced YAMNet Bark Detector v3.0")
-    logger.info("ML-based Detection with Legal Evidence Collection")
-    logger.info("=" * 70)
-    
-    # Initialize detector
-    config = {
-        'sensitivity': args.sensitivity,
-        'sample_rate': 16000,          # YAMNet requirement
-        'chunk_size': 1024,
-        'channels': 1,
-        'quiet_duration': 30.0,
-        'session_gap_threshold': 10.0,  # Recording sessions
-        'output_dir': args.output_dir,
-        'profile_name': args.save_profile
-    }
-    
-    detector = AdvancedBarkDetector(**config)
+def _handle_list_profiles(args, detector):
+    """List saved calibration profiles."""
+    profiles = detector.list_profiles()
+    if profiles:
+        lines = ["📂 Available Calibration Profiles:"]
+        for profile in profiles:
+            lines.append(f"  {profile['name']} - Sensitivity: {profile['sensitivity']:.3f}")
+            lines.append(f"    Created: {profile['created'][:10]} - {profile['notes']}")
+        logger.info("\n".join(lines))
+    else:
+        logger.info("No calibration profiles found")
+
+
+def _handle_list_convertible(args, detector):
+    """List audio files in a directory that can be used for calibration."""
+    calibrator = FileBasedCalibration(detector)
+    directory = Path(args.list_convertible).expanduser()
     
-    # Handle different modes
-    if args.list_profiles:
-        profiles = detector.list_profiles()
-        if profiles:
-            logger.info("📂 Available Calibration Profiles:")
-            for profile in profiles:
-                logger.info(f"  {profile['name']} - Sensitivity: {profile['sensitivity']:.3f}")
-                logger.info(f"    Created: {profile['created'][:10]} - {profile['notes']}")
-        else:
-            logger.info("No calibration profiles found")
+    if not directory.exists():
+        logger.error(f"Directory not found: {directory}")
         return
     
-    if args.list_convertible:
-        calibrator = FileBasedCalibration(detector)
-        directory = Path(args.list_convertible).expanduser()
-        
-        if not directory.exists():
-            logger.error(f"Directory not found: {directory}")
-            return
-        
-        logger.info(f"🔍 Scanning {directory} for convertible audio files...")
-        found_files = calibrator.list_convertible_files(directory)
+    logger.info(f"🔍 Scanning {directory} for convertible audio files...")
+    found_files = calibrator.list_convertible_files(directory)
+    
+    if found_files:
+        lines = [f"📁 Found {len(found_files)} convertible audio files:"]
+        total_duration = 0
         
-        if found_files:
-            logger.info(f"📁 Found {len(found_files)} convertible audio files:")
-            total_duration = 0
+        for file_info in found_files:
+            path = file_info['path']
+            file_type = file_info['type']
+            duration = file_info['duration']
+            sample_rate = file_info['sample_rate']
+            size_mb = file_info['size_mb']
             
-            for file_info in found_files:
-                path = file_info['path']
-                file_type = file_info['type']
-                duration = file_info['duration']
-                sample_rate = file_info['sample_rate']
-                size_mb = file_info['size_mb']
-                
-                duration_str = f"{duration:.1f}s" if duration > 0 else "Unknown"
-                sr_str = f"{sample_rate}Hz" if sample_rate > 0 else "Unknown"
-                
-                logger.info(f"  📄 {path.name}")
-                logger.info(f"     Type: {file_type}, Duration: {duration_str}, Sample Rate: {sr_str}, Size: {size_mb:.1f}MB")
-                
-                if duration > 0:
-                    total_duration += duration
+            duration_str = f"{duration:.1f}s" if duration > 0 else "Unknown"
+            sr_str = f"{sample_rate}Hz" if sample_rate > 0 else "Unknown"
             
-            if total_duration > 0:
-                total_min = total_duration / 60
-                logger.info(f"\n📊 Total duration: {total_min:.1f} minutes")
-                
-            logger.info(f"\n💡 To use these files for calibration:")
-            logger.info(f"  uv run bd.py --calibrate-files --audio-files {' '.join(str(f['path']) for f in found_files[:3])}")
-        else:
-            logger.info("No convertible audio files found")
-            logger.info("Supported formats: WAV, M4A, MP3, AAC, FLAC (including Voice Memos)")
-        return
-    
-    # Manual recording mode
-    if args.record:
-        output_path = Path(args.record)
+            lines.append(f"  📄 {path.name}")
+            lines.append(f"     Type: {file_type}, Duration: {duration_str}, Sample Rate: {sr_str}, Size: {size_mb:.1f}MB")
+            
+            if duration > 0:
+                total_duration += duration
         
-        # Ensure the file has .wav extension
-        if output_path.suffix.lower() != '.wav':
-            output_path = output_path.with_suffix('.wav')
+        if total_duration > 0:
+            total_min = total_duration / 60
+            lines.append(f"\n📊 Total duration: {total_min:.1f} minutes")
         
-        logger.info("🎙️  Starting manual recording mode for calibration...")
-        recorder = ManualRecorder(detector, output_path)
-        recorder.start_recording()
-        return
+        example_paths = [str(f['path']) for f in found_files[:3]]
+        lines.append(f"\n💡 To use these files for calibration:")
+        lines.append(f"  uv run bd.py --calibrate-files --audio-files {' '.join(example_paths)}")
+        logger.info("\n".join(lines))
+    else:
+        logger.info("No convertible audio files found")
+        logger.info("Supported formats: WAV, M4A, MP3, AAC, FLAC (including Voice Memos)")
+
+
+def _handle_record(args, detector):
+    """Record a calibration sample from the microphone."""
+    output_path = Path(args.record)
     
-    # Violation analysis commands
-    if args.analyze_violations:
-        target_date = args.analyze_violations
-        logger.info(f"🔍 Analyzing recordings for violations on {target_date}")
-        try:
-            violations = detector.analyze_violations_for_date(target_date)
-            if violations:
-                logger.info(f"✅ Found {len(violations)} violations:")
-                for violation in violations:
-                    logger.info(f"  📅 {violation.date} {violation.start_time} - {violation.end_time}")
-                    logger.info(f"     Type: {violation.violation_type}, Duration: {violation.total_bark_duration/60:.1f}min")
-            else:
-                logger.info("✅ No violations detected for this date")
-        except Exception as e:
-            logger.error(f"❌ Error analyzing violations: {e}")
-        return
+    # Ensure the file has .wav extension
+    if output_path.suffix.lower() != '.wav':
+        output_path = output_path.with_suffix('.wav')
     
-    if args.violation_report:
-        start_date, end_date = args.violation_report
-        logger.info(f"📊 Generating violation report for {start_date} to {end_date}")
-        try:
-            violations = detector.generate_violation_report(start_date, end_date)
-            if violations:
-                logger.info(f"📋 Violation Report ({len(violations)} violations):")
-                for violation in violations:
-                    logger.info(f"  📅 {violation.date} {violation.start_time} - {violation.end_time}")
-                    logger.info(f"     Type: {violation.violation_type}")
-                    logger.info(f"     Bark Duration: {violation.total_bark_duration/60:.1f}min")
-                    logger.info(f"     Incident Duration: {violation.total_incident_duration/60:.1f}min")
-                    logger.info(f"     Audio Files: {', '.join(violation.audio_files)}")
-            else:
-                logger.info("📋 No violations found in date range")
-        except Exception as e:
-            logger.error(f"❌ Error generating report: {e}")
+    logger.info("🎙️  Starting manual recording mode for calibration...")
+    recorder = ManualRecorder(detector, output_path)
+    recorder.start_recording()
+
+
+def _handle_analyze_violations(args, detector):
+    """Analyze recordings for bylaw violations on one date."""
+    target_date = args.analyze_violations
+    logger.info(f"🔍 Analyzing recordings for violations on {target_date}")
+    try:
+        violations = detector.analyze_violations_for_date(target_date)
+        if violations:
+            logger.info(f"✅ Found {len(violations)} violations:")
+            for violation in violations:
+                logger.info(f"  📅 {violation.date} {violation.start_time} - {violation.end_time}")
+                logger.info(f"     Type: {violation.violation_type}, Duration: {violation.total_bark_duration/60:.1f}min")
+        else:
+            logger.info("✅ No violations detected for this date")
+    except Exception as e:
+        logger.error(f"❌ Error analyzing violations: {e}")
+
+
+def _handle_violation_report(args, detector):
+    """Show violations for a date range."""
+    start_date, end_date = args.violation_report
+    logger.info(f"📊 Generating violation report for {start_date} to {end_date}")
+    try:
+        violations = detector.generate_violation_report(start_date, end_date)
+        if violations:
+            lines = [f"📋 Violation Report ({len(violations)} violations):"]
+            for violation in violations:
+                lines.append(f"  📅 {violation.date} {violation.start_time} - {violation.end_time}")
+                lines.append(f"     Type: {violation.violation_type}")
+                lines.append(f"     Bark Duration: {violation.total_bark_duration/60:.1f}min")
+                lines.append(f"     Incident Duration: {violation.total_incident_duration/60:.1f}min")
+                lines.append(f"     Audio Files: {', '.join(violation.audio_files)}")
+            logger.info("\n".join(lines))
+        else:
+            logger.info("📋 No violations found in date range")
+    except Exception as e:
+        logger.error(f"❌ Error generating report: {e}")
+
+
+def _handle_list_violations(args, detector):
+    """List all detected violations."""
+    logger.info("📋 Listing all detected violations:")
+    try:
+        violations = detector.list_violations()
+        if violations:
+            lines = [f"Found {len(violations)} total violations:"]
+            for violation in violations:
+                lines.append(f"  📅 {violation.date} {violation.start_time} - {violation.end_time}")
+                lines.append(f"     Type: {violation.violation_type}, Duration: {violation.total_bark_duration/60:.1f}min")
+            logger.info("\n".join(lines))
+        else:
+            logger.info("No violations detected yet")
+    except Exception as e:
+        logger.error(f"❌ Error listing violations: {e}")
+
+
+def _handle_export_violations(args, detector):
+    """Export violations to CSV."""
+    output_path = Path(args.export_violations)
+    logger.info(f"📄 Exporting violations to {output_path}")
+    try:
+        detector.export_violations_csv(output_path)
+        logger.info(f"✅ Violations exported successfully")
+    except Exception as e:
+        logger.error(f"❌ Error exporting violations: {e}")
+
+
+def _handle_convert_all(args, detector):
+    """Convert all audio files recorded on a date."""
+    target_date = args.convert_all
+    logger.info(f"🔄 Converting all audio files for date: {target_date}")
+    try:
+        converter = AudioFileConverter()
+        recordings_dir = Path(args.output_dir)
+        results = converter.convert_files_for_date(recordings_dir, target_date)
+        
+        if results['converted'] > 0:
+            logger.info(f"✅ Successfully converted {results['converted']} files")
+        elif results['total_files'] == 0:
+            logger.info(f"📁 No audio files found for date {target_date}")
+        else:
+            logger.info(f"ℹ️  All files already converted or failed")
+            
+    except Exception as e:
+        logger.error(f"❌ Error converting files: {e}")
+
+
+def _handle_convert_files(args, detector):
+    """Convert specific audio files."""
+    file_paths = [Path(f) for f in args.convert_files]
+    logger.info(f"🔄 Converting {len(file_paths)} specific files")
+    try:
+        converter = AudioFileConverter()
+        results = converter.convert_specific_files(file_paths)
+        
+        if results['converted'] > 0:
+            logger.info(f"✅ Successfully converted {results['converted']} files")
+        elif results['total_files'] == 0:
+            logger.info(f"📁 No valid files to convert")
+        else:
+            logger.info(f"ℹ️  All files already converted or failed")
+            
+    except Exception as e:
+        logger.error(f"❌ Error converting files: {e}")
+
+
+def _handle_convert_directory(args, detector):
+    """Convert all audio files in a directory."""
+    directory = Path(args.convert_directory)
+    logger.info(f"🔄 Converting all audio files in directory: {directory}")
+    try:
+        converter = AudioFileConverter()
+        results = converter.convert_directory(directory)
+        
+        if results['converted'] > 0:
+            logger.info(f"✅ Successfully converted {results['converted']} files")
+        elif results['total_files'] == 0:
+            logger.info(f"📁 No convertible files found in {directory}")
+        else:
+            logger.info(f"ℹ️  All files already converted or failed")
+            
+    except Exception as e:
+        logger.error(f"❌ Error converting directory: {e}")
+
+
+def _handle_create_template(args, detector):
+    """Create a ground truth template for an audio file."""
+    audio_path = Path(args.create_template)
+    if not audio_path.exists():
+        logger.error(f"Audio file not found: {audio_path}")
         return
     
-    if args.list_violations:
-        logger.info("📋 Listing all detected violations:")
-        try:
-            violations = detector.list_violations()
-            if violations:
-                logger.info(f"Found {len(violations)} total violations:")
-                for violation in violations:
-                    logger.info(f"  📅 {violation.date} {violation.start_time} - {violation.end_time}")
-                    logger.info(f"     Type: {violation.violation_type}, Duration: {violation.total_bark_duration/60:.1f}min")
-            else:
-                logger.info("No violations detected yet")
-        except Exception as e:
-            logger.error(f"❌ Error listing violations: {e}")
+    calibrator = FileBasedCalibration(detector)
+    template_path = calibrator.create_ground_truth_template(audio_path)
+    logger.info(f"✅ Template created: {template_path}")
+    logger.info("Edit the template file to add bark timestamps, then run:")
+    logger.info(f"  uv run bd.py --calibrate-files --audio-files {audio_path} --ground-truth-files {template_path}")
+
+
+def _handle_calibrate(args, detector):
+    """Run an interactive real-time calibration session."""
+    logger.info(f"🎯 Starting {args.duration}-minute calibration session")
+    logger.info("Make sure dogs are likely to bark during this time!")
+    
+    profile = detector.start_calibration(args.duration)
+    
+    if profile:
+        # Save profile if name provided
+        if args.save_profile:
+            detector.save_profile(profile)
+            logger.info(f"✅ Calibration complete! Profile '{args.save_profile}' saved.")
+            logger.info(f"   To use: uv run bd.py --profile {args.save_profile}")
+        else:
+            logger.info("✅ Calibration complete! Use --save-profile to save settings.")
+
+
+def _handle_calibrate_files(args, detector):
+    """Run file-based calibration against ground truth."""
+    if not args.audio_files:
+        logger.error("--audio-files required for file-based calibration")
+        logger.info("Example: uv run bd.py --calibrate-files --audio-files bark1.wav bark2.wav")
         return
     
-    if args.export_violations:
-        output_path = Path(args.export_violations)
-        logger.info(f"📄 Exporting violations to {output_path}")
-        try:
-            detector.export_violations_csv(output_path)
-            logger.info(f"✅ Violations exported successfully")
-        except Exception as e:
-            logger.error(f"❌ Error exporting violations: {e}")
-        return
+    logger.info("📁 Starting file-based calibration...")
     
-    # Audio conversion commands
-    if args.convert_all:
-        target_date = args.convert_all
-        logger.info(f"🔄 Converting all audio files for date: {target_date}")
-        try:
-            converter = AudioFileConverter()
-            recordings_dir = Path(args.output_dir)
-            results = converter.convert_files_for_date(recordings_dir, target_date)
-            
-            if results['converted'] > 0:
-                logger.info(f"✅ Successfully converted {results['converted']} files")
-            elif results['total_files'] == 0:
-                logger.info(f"📁 No audio files found for date {target_date}")
-            else:
-                logger.info(f"ℹ️  All files already converted or failed")
-                
-        except Exception as e:
-            logger.error(f"❌ Error converting files: {e}")
-        return
+    calibrator = FileBasedCalibration(detector)
     
-    if args.convert_files:
-        file_paths = [Path(f) for f in args.convert_files]
-        logger.info(f"🔄 Converting {len(file_paths)} specific files")
-        try:
-            converter = AudioFileConverter()
-            results = converter.convert_specific_files(file_paths)
-            
-            if results['converted'] > 0:
-                logger.info(f"✅ Successfully converted {results['converted']} files")
-            elif results['total_files'] == 0:
-                logger.info(f"📁 No valid files to convert")
-            else:
-                logger.info(f"ℹ️  All files already converted or failed")
-                
-        except Exception as e:
-            logger.error(f"❌ Error converting files: {e}")
-        return
+    # Add test files
+    audio_paths = [Path(f) for f in args.audio_files]
+    ground_truth_paths = []
     
-    if args.convert_directory:
-        directory = Path(args.convert_directory)
-        logger.info(f"🔄 Converting all audio files in directory: {directory}")
-        try:
-            converter = AudioFileConverter()
-            results = converter.convert_directory(directory)
-            
-            if results['converted'] > 0:
-                logger.info(f"✅ Successfully converted {results['converted']} files")
-            elif results['total_files'] == 0:
-                logger.info(f"📁 No convertible files found in {directory}")
-            else:
-                logger.info(f"ℹ️  All files already converted or failed")
-                
-        except Exception as e:
-            logger.error(f"❌ Error converting directory: {e}")
-        return
+    if args.ground_truth_files:
+        if len(args.ground_truth_files) > len(args.audio_files):
+            logger.error("Cannot have more ground truth files than audio files")
+            return
+        ground_truth_paths = [Path(f) for f in args.ground_truth_files]
     
-    # Create ground truth template
-    if args.create_template:
-        audio_path = Path(args.create_template)
+    # Validate files exist
+    for audio_path in audio_paths:
         if not audio_path.exists():
             logger.error(f"Audio file not found: {audio_path}")
             return
+    
+    for gt_path in ground_truth_paths:
+        if not gt_path.exists():
+            logger.error(f"Ground truth file not found: {gt_path}")
+            return
+    
+    # Add files to calibrator
+    for i, audio_path in enumerate(audio_paths):
+        gt_path = ground_truth_paths[i] if i < len(ground_truth_paths) else None
+        calibrator.add_test_file(audio_path, gt_path)
+    
+    # Run calibration
+    try:
+        results = calibrator.run_sensitivity_sweep(
+            sensitivity_range=tuple(args.sensitivity_range),
+            steps=args.steps
+        )
         
-        calibrator = FileBasedCalibration(detector)
-        template_path = calibrator.create_ground_truth_template(audio_path)
-        logger.info(f"✅ Template created: {template_path}")
-        logger.info("Edit the template file to add bark timestamps, then run:")
-        logger.info(f"  uv run bd.py --calibrate-files --audio-files {audio_path} --ground-truth-files {template_path}")
+        # Create and save profile if requested
+        if args.save_profile:
+            profile = calibrator.generate_calibration_profile(results, args.save_profile)
+            detector.save_profile(profile)
+            logger.info(f"✅ File-based calibration complete! Profile '{args.save_profile}' saved.")
+            logger.info(f"   To use: uv run bd.py --profile {args.save_profile}")
+        else:
+            logger.info("✅ File-based calibration complete! Use --save-profile to save settings.")
+            
+    except Exception as e:
+        logger.error(f"Calibration failed: {e}")
+
+
+# Commands handled before a profile is loaded, in precedence order (the first
+# selected one runs): args attribute -> (handler, whether it needs YAMNet)
+COMMAND_HANDLERS = {
+    'list_profiles': (_handle_list_profiles, False),
+    'list_convertible': (_handle_list_convertible, False),
+    'record': (_handle_record, False),
+    'analyze_violations': (_handle_analyze_violations, True),
+    'violation_report': (_handle_violation_report, False),
+    'list_violations': (_handle_list_violations, False),
+    'export_violations': (_handle_export_violations, False),
+    'convert_all': (_handle_convert_all, False),
+    'convert_files': (_handle_convert_files, False),
+    'convert_directory': (_handle_convert_directory, False),
+    'create_template': (_handle_create_template, False),
+}
+
+
+def main():
+    """Main function with command line support."""
+    args = parse_arguments()
+    
+    logger.info("=" * 70)
+    logger.info("Advanced YAMNet Bark Detector v3.0")
+    logger.info("ML-based Detection with Legal Evidence Collection")
+    logger.info("=" * 70)
+    
+    if args.export_onnx:
+        export_yamnet_onnx(quantize=args.quantize)
+        logger.info("The detector will use the ONNX model when onnxruntime is installed")
         return
     
+    # First selected command wins; without one we calibrate or monitor, which need YAMNet
+    command = next((name for name in COMMAND_HANDLERS if getattr(args, name)), None)
+    handler, load_model = COMMAND_HANDLERS[command] if command else (None, True)
+    
+    # Initialize detector
+    config = {
+        'sensitivity': args.sensitivity,
+        'sample_rate': 16000,          # YAMNet requirement
+        'chunk_size': 1024,
+        'channels': 1,
+        'quiet_duration': 30.0,
+        'session_gap_threshold': 10.0,  # Recording sessions
+        'output_dir': args.output_dir,
+        'profile_name': args.save_profile,
+        'load_model': load_model,
+        'onnx_int8': args.int8
+    }
+    
+    detector = AdvancedBarkDetector(**config)
+    
+    if handler is not None:
+        return handler(args, detector)
+    
     # Load profile if specified
     if args.profile:
         try:
@@ -3022,81 +4104,11 @@ def main():
                     logger.info(f"  {profile['name']}")
             return
     
-    # Run calibration mode
     if args.calibrate:
-        logger.info(f"🎯 Starting {args.duration}-minute calibration session")
-        logger.info("Make sure dogs are likely to bark during this time!")
-        
-        profile = detector.start_calibration(args.duration)
-        
-        if profile:
-            # Save profile if name provided
-            if args.save_profile:
-                detector.save_profile(profile)
-                logger.info(f"✅ Calibration complete! Profile '{args.save_profile}' saved.")
-                logger.info(f"   To use: uv run bd.py --profile {args.save_profile}")
-            else:
-                logger.info("✅ Calibration complete! Use --save-profile to save settings.")
-        
-        return
+        return _handle_calibrate(args, detector)
     
-    # File-based calibration mode
     if args.calibrate_files:
-        if not args.audio_files:
-            logger.error("--audio-files required for file-based calibration")
-            logger.info("Example: uv run bd.py --calibrate-files --audio-files bark1.wav bark2.wav")
-            return
-        
-        logger.info("📁 Starting file-based calibration...")
-        
-        calibrator = FileBasedCalibration(detector)
-        
-        # Add test files
-        audio_paths = [Path(f) for f in args.audio_files]
-        ground_truth_paths = []
-        
-        if args.ground_truth_files:
-            if len(args.ground_truth_files) > len(args.audio_files):
-                logger.error("Cannot have more ground truth files than audio files")
-                return
-            ground_truth_paths = [Path(f) for f in args.ground_truth_files]
-        
-        # Validate files exist
-        for audio_path in audio_paths:
-            if not audio_path.exists():
-                logger.error(f"Audio file not found: {audio_path}")
-                return
-        
-        for gt_path in ground_truth_paths:
-            if not gt_path.exists():
-                logger.error(f"Ground truth file not found: {gt_path}")
-                return
-        
-        # Add files to calibrator
-        for i, audio_path in enumerate(audio_paths):
-            gt_path = ground_truth_paths[i] if i < len(ground_truth_paths) else None
-            calibrator.add_test_file(audio_path, gt_path)
-        
-        # Run calibration
-        try:
-            results = calibrator.run_sensitivity_sweep(
-                sensitivity_range=tuple(args.sensitivity_range),
-                steps=args.steps
-            )
-            
-            # Create and save profile if requested
-            if args.save_profile:
-                profile = calibrator.generate_calibration_profile(results, args.save_profile)
-                detector.save_profile(profile)
-                logger.info(f"✅ File-based calibration complete! Profile '{args.save_profile}' saved.")
-                logger.info(f"   To use: uv run bd.py --profile {args.save_profile}")
-            else:
-                logger.info("✅ File-based calibration complete! Use --save-profile to save settings.")
-                
-        except Exception as e:
-            logger.error(f"Calibration failed: {e}")
-        
-        return
+        return _handle_calibrate_files(args, detector)
     
     # Normal detection mode
     logger.info("🐕 Starting bark detection...")
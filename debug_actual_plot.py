@@ -5,90 +5,108 @@ Debug script to generate the exact same plot as the PDF to see what's happening.
 
 import sys
 from pathlib import Path
-from datetime import datetime
-import matplotlib
-matplotlib.use('Agg')  # Use non-GUI backend
-import matplotlib.pyplot as plt
+import numpy as np
 
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from bark_detector.utils.pdf_generator import PDFGenerationService, PDFConfig
-from bark_detector.legal.database import ViolationDatabase
-
-def create_debug_plot():
-    """Create the exact same plot as the PDF generator to debug intensity values."""
-
-    # Load the data for 2025-09-23
-    violation_db = ViolationDatabase()
-    violations = violation_db.load_violations_new("2025-09-23")
-    bark_events = violation_db.load_events("2025-09-23")
+from debug_data import load_day, hhmmss_to_seconds
+
+def create_debug_plot(fig=None, ax=None, date="2025-09-23"):
+    """
+    Create the exact same plot as the PDF generator to debug intensity values.
+
+    Pass the fig/ax from a previous call to redraw into them: the axes are
+    cleared and reused, so interactive sessions only pay the backend and
+    font setup once, e.g.
+
+        fig, ax = plt.subplots(figsize=(12, 6))
+        create_debug_plot(fig, ax)  # tweak, reload, run again
+    """
+    # Matplotlib is only needed once we actually plot
+    import matplotlib
+    if fig is None:
+        matplotlib.use('Agg')  # Use non-GUI backend
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
+    # Load the data for the date; only events within the 6am-8pm window are plotted,
+    # so the rest are dropped while loading
+    violations, bark_events = load_day(date, hour_range=(6, 20))
 
     config = PDFConfig()
     target_id = "8fdaba48-428a-411e-b1ad-42084ad43c0e"
 
-    print(f"Loaded {len(violations)} violations and {len(bark_events)} events")
+    print(f"Loaded {len(violations)} violations and {len(bark_events)} events between 6am and 8pm")
 
     # Create the exact same plot as _generate_activity_timeline
-    fig, ax = plt.subplots(figsize=(12, 6))
+    owns_figure = fig is None
+    if owns_figure:
+        fig, ax = plt.subplots(figsize=(12, 6))
+    else:
+        ax.cla()
     fig.patch.set_facecolor('white')
 
-    # Create mapping of bark events to violation types for color coding
-    bark_event_colors = {}
-    for violation in violations:
-        color = '#DC2626' if violation.type == "Continuous" else '#F59E0B'  # Red for continuous, orange for intermittent
-        for bark_id in violation.barkEventIds:
-            bark_event_colors[bark_id] = color
-
-    # Track plotting for target event
-    target_event_plotted = False
-    plot_data = []
-
-    # Plot all bark events as vertical lines (EXACT code from pdf_generator.py)
-    for event in bark_events:
-        # Parse event timestamp
-        event_dt = datetime.fromisoformat(f"{event.realworld_date}T{event.realworld_time}.000Z")
-        event_hour = event_dt.hour + event_dt.minute / 60
-
-        # Only plot events within 6am-8pm window
-        if 6 <= event_hour <= 20:
-            # Determine color based on violation association
-            color = bark_event_colors.get(event.bark_id, '#9CA3AF')  # Gray for non-violation events
-
-            # Plot vertical line for bark event with height based on intensity
-            intensity = getattr(event, 'intensity', config.default_intensity)
-            # Use default intensity if intensity is 0.0 (missing/invalid data)
-            if intensity == 0.0:
-                intensity = config.default_intensity
-
-            # This is the actual plot command from the PDF generator
-            ax.plot([event_hour, event_hour], [0, intensity], color=color, alpha=0.7, linewidth=1.5)
-
-            # Track our target event
-            if event.bark_id == target_id:
-                target_event_plotted = True
-                plot_data.append({
-                    'id': event.bark_id,
-                    'time': event.realworld_time,
-                    'hour': event_hour,
-                    'raw_intensity': event.intensity,
-                    'processed_intensity': intensity,
-                    'color': color
-                })
-                print(f"\n*** TARGET EVENT PLOTTED ***")
-                print(f"  ID: {event.bark_id}")
-                print(f"  Time: {event.realworld_time}")
-                print(f"  Hour: {event_hour}")
-                print(f"  Raw intensity: {event.intensity}")
-                print(f"  Processed intensity: {intensity}")
-                print(f"  Plot command: ax.plot([{event_hour}, {event_hour}], [0, {intensity}], color='{color}', alpha=0.7, linewidth=1.5)")
-
-    # Formatting for 6am-8pm window (EXACT code from pdf_generator.py)
+    # Bark event IDs per violation type for color coding
+    continuous_ids = np.array([bid for v in violations if v.type == "Continuous" for bid in v.barkEventIds], dtype=str)
+    intermittent_ids = np.array([bid for v in violations if v.type != "Continuous" for bid in v.barkEventIds], dtype=str)
+
+    # Event hours (to the minute) from the "HH:MM:SS" times, parsed for all events at once
+    times = np.array([event.realworld_time for event in bark_events], dtype=str)
+    hours = (hhmmss_to_seconds(times) // 60) / 60
+
+    # Intensity per event; 0.0 (missing/invalid data) falls back to the default intensity
+    raw_intensities = np.fromiter((event.intensity for event in bark_events), dtype=float, count=len(bark_events))
+    intensities = np.where(raw_intensities == 0.0, config.default_intensity, raw_intensities)
+    # Palette index per event: gray for non-violation, orange for intermittent, red for
+    # continuous (np.isin does the sorted ID lookups in C)
+    palette = np.array(['#9CA3AF', '#F59E0B', '#DC2626'])
+    ids = np.array([event.bark_id for event in bark_events], dtype=str)
+    color_idx = np.where(np.isin(ids, continuous_ids), 2, np.isin(ids, intermittent_ids).astype(np.intp))
+    colors = palette[color_idx]
+
+    # One vertical line per bark event (height = intensity), drawn as a single collection
+    segments = np.stack([
+        np.stack([hours, np.zeros_like(hours)], axis=1),
+        np.stack([hours, intensities], axis=1)
+    ], axis=1)
+    # Limits are fixed to the 6am-8pm window, so they are set up front and the collection is
+    # added without updating data limits (autolim=False skips a pass over every segment)
+    ax.set_autoscale_on(False)
     ax.set_xlim(5.5, 20.5)  # 6am to 8pm with slight margins
     ax.set_ylim(0, 1)
+    # Rasterized so a vector output format (.pdf/.svg) gets one image instead of a path per event;
+    # anti-aliasing thin vertical lines makes no visible difference at this resolution
+    ax.add_collection(LineCollection(segments, colors=colors.tolist(), alpha=0.7, linewidths=1.5,
+                                     rasterized=True, antialiaseds=False),
+                      autolim=False)
+
+    # Track our target event: plot data is one column per field, sliced from the
+    # arrays that were just plotted (pd.DataFrame(plot_data) for a table view)
+    is_target = ids == target_id
+    plot_data = {
+        'id': ids[is_target],
+        'time': times[is_target],
+        'hour': hours[is_target],
+        'raw_intensity': raw_intensities[is_target],
+        'processed_intensity': intensities[is_target],
+        'color': colors[is_target]
+    }
+    target_event_plotted = bool(is_target.any())
+    for bark_id, time_str, event_hour, raw, intensity, color in zip(*plot_data.values()):
+        print(f"\n*** TARGET EVENT PLOTTED ***")
+        print(f"  ID: {bark_id}")
+        print(f"  Time: {time_str}")
+        print(f"  Hour: {event_hour}")
+        print(f"  Raw intensity: {raw}")
+        print(f"  Processed intensity: {intensity}")
+        print(f"  Plotted as line from ({event_hour}, 0) to ({event_hour}, {intensity}) color='{color}'")
+
+    # Formatting for 6am-8pm window (EXACT code from pdf_generator.py)
     ax.set_xlabel('Time of Day (6am - 8pm)', fontsize=12, fontweight='bold')
     ax.set_ylabel('Bark Intensity (0.0 - 1.0)', fontsize=12, fontweight='bold')
-    ax.set_title(f'Bark Activity Chart for 2025-09-23 (6:00 AM - 8:00 PM)', fontsize=14, fontweight='bold', pad=20)
+    ax.set_title(f'Bark Activity Chart for {date} (6:00 AM - 8:00 PM)', fontsize=14, fontweight='bold', pad=20)
 
     # Set time ticks for 6am-8pm range
     ax.set_xticks(range(6, 21, 2))
@@ -102,10 +120,11 @@ def create_debug_plot():
     ax.grid(True, alpha=0.3, linestyle='-', linewidth=0.5, axis='both')
     ax.set_facecolor('#FAFAFA')
 
-    # Save the plot
-    plt.tight_layout()
-    plt.savefig('debug_activity_chart.png', dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    # Save the plot (a figure passed in by the caller stays open for the next run)
+    fig.tight_layout()
+    fig.savefig('debug_activity_chart.png', dpi=300, bbox_inches='tight', facecolor='white')
+    if owns_figure:
+        plt.close(fig)
 
     print(f"\nTarget event plotted: {target_event_plotted}")
     print(f"Plot saved as debug_activity_chart.png")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Shared, memoized loading of a day's violations and bark events for the debug scripts.
+"""
+
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+# Add current directory to path to import bark_detector modules
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bark_detector.legal.database import ViolationDatabase
+
+
+def _mtime(path: Path):
+    """Modification time of path, or None if it doesn't exist."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _load_day(violations_dir: str, date: str, violations_mtime, events_mtime, hour_range):
+    """Load one day from disk. The mtimes are only part of the cache key."""
+    violation_db = ViolationDatabase(violations_dir=Path(violations_dir))
+    return (tuple(violation_db.load_violations_new(date)),
+            tuple(violation_db.load_events_iter(date, hour_range=hour_range)))
+
+
+def load_day(date: str, violations_dir: Path = None, hour_range: tuple = None):
+    """
+    Load violations and bark events for a date, reusing earlier loads.
+
+    Results are cached per file modification time, so editing either
+    JSON file invalidates the cached entry. The returned tuples are
+    shared between callers and must not be modified.
+
+    Args:
+        date: Date in YYYY-MM-DD format
+        violations_dir: Violations directory (default: ./violations)
+        hour_range: Only load events inside this inclusive (start_hour, end_hour)
+            window, e.g. (6, 20); None loads every event
+
+    Returns:
+        (violations, bark_events) tuples
+    """
+    violation_db = ViolationDatabase(violations_dir=violations_dir or Path.cwd() / 'violations')
+    return _load_day(
+        str(violation_db.violations_dir),
+        date,
+        _mtime(violation_db._get_violations_file_path(date)),
+        _mtime(violation_db._get_events_file_path(date)),
+        tuple(hour_range) if hour_range is not None else None,
+    )
+
+
+def hhmmss_to_seconds(times):
+    """
+    Convert "HH:MM:SS" strings to seconds since midnight, as an int64 array.
+
+    Zero-padded values are parsed all at once from the digit code points of a
+    fixed-width string array. If any value doesn't have exactly that shape
+    (e.g. "9:05:00"), every value is parsed with split(':') instead, which
+    raises ValueError for anything that isn't a time.
+    """
+    strings = np.array(times, dtype=str)
+    if strings.dtype.itemsize == 8 * 4 and strings.size:
+        codes = strings.view(np.uint32).reshape(-1, 8).astype(np.int64)
+        digits = codes[:, [0, 1, 3, 4, 6, 7]] - ord('0')
+        if ((codes[:, [2, 5]] == ord(':')).all() and ((digits >= 0) & (digits <= 9)).all()
+                and (np.char.str_len(strings) == 8).all()):
+            return ((digits[:, 0] * 10 + digits[:, 1]) * 3600 + (digits[:, 2] * 10 + digits[:, 3]) * 60
+                    + digits[:, 4] * 10 + digits[:, 5])
+
+    seconds = []
+    for value in strings.tolist():
+        hours, minutes, secs = value.split(':')
+        seconds.append(int(hours) * 3600 + int(minutes) * 60 + int(secs))
+    return np.array(seconds, dtype=np.int64)
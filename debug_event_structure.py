@@ -3,11 +3,15 @@
 Debug script to check the actual structure of events returned by the detector
 """
 
-import librosa
 import numpy as np
+import soundfile as sf
+from collections import namedtuple
 from pathlib import Path
 from bark_detector.core.detector import AdvancedBarkDetector
 
+# Minimal event with absolute times, as fed to violation analysis
+AbsEvent = namedtuple('AbsEvent', 'start_time end_time confidence')
+
 def test_detector_events():
     """Test what the detector actually returns for a sample audio file."""
 
@@ -27,8 +31,14 @@ def test_detector_events():
 
     print(f"Analyzing: {audio_file.name}")
 
-    # Load audio
-    audio_data, sr = librosa.load(str(audio_file), sr=detector.sample_rate)
+    # Load audio straight through libsndfile; recordings are already 16kHz
+    audio_data, sr = sf.read(str(audio_file), dtype='float32', always_2d=False)
+    if audio_data.ndim > 1:
+        audio_data = audio_data.mean(axis=1)
+    if sr != detector.sample_rate:
+        import librosa
+        audio_data = librosa.resample(audio_data, orig_sr=sr, target_sr=detector.sample_rate)
+        sr = detector.sample_rate
     print(f"Audio duration: {len(audio_data) / sr:.2f} seconds")
 
     # Analyze with analysis sensitivity
@@ -56,12 +66,8 @@ def test_detector_events():
     # Create absolute timestamp events (simulating the real process)
     absolute_events = []
     for event in bark_events:
-        absolute_event = type('BarkEvent', (), {
-            'start_time': event.start_time,  # Using relative time for test
-            'end_time': event.end_time,
-            'confidence': event.confidence
-        })()
-        absolute_events.append(absolute_event)
+        # Using relative time for test
+        absolute_events.append(AbsEvent(event.start_time, event.end_time, event.confidence))
 
     continuous_violations = tracker._analyze_continuous_violations_from_events(absolute_events)
     sporadic_violations = tracker._analyze_sporadic_violations_from_events(absolute_events)
@@ -5,21 +5,18 @@ Debug script to reproduce the intensity visualization issue.
 
 import sys
 from pathlib import Path
-from datetime import datetime
 
 # Add current directory to path to import bark_detector modules
 sys.path.insert(0, str(Path(__file__).parent))
 
 from bark_detector.utils.pdf_generator import PDFGenerationService
-from bark_detector.legal.database import ViolationDatabase
+from debug_data import load_day
 
 def debug_intensity_visualization():
     """Debug the intensity visualization for the specific event."""
 
     # Load the data for 2025-09-23
-    violation_db = ViolationDatabase()
-    violations = violation_db.load_violations_new("2025-09-23")
-    bark_events = violation_db.load_events("2025-09-23")
+    violations, bark_events = load_day("2025-09-23")
 
     print(f"Loaded {len(violations)} violations and {len(bark_events)} events")
 
@@ -40,8 +37,9 @@ def debug_intensity_visualization():
         print(f"  Confidence: {target_event.confidence}")
 
         # Check how this event is processed in the visualization
-        event_dt = datetime.fromisoformat(f"{target_event.realworld_date}T{target_event.realworld_time}.000Z")
-        event_hour = event_dt.hour + event_dt.minute / 60
+        # realworld_time is zero-padded HH:MM:SS, so hour and minute are fixed slices
+        t = target_event.realworld_time
+        event_hour = int(t[0:2]) + int(t[3:5]) / 60
 
         print(f"\nVisualization processing:")
         print(f"  Event hour: {event_hour}")
@@ -51,9 +49,8 @@ def debug_intensity_visualization():
         from bark_detector.utils.pdf_generator import PDFConfig
         config = PDFConfig()
 
-        intensity = getattr(target_event, 'intensity', config.default_intensity)
-        if intensity == 0.0:
-            intensity = config.default_intensity
+        # 0.0 means missing/invalid data, so the default intensity is used
+        intensity = target_event.intensity or config.default_intensity
 
         print(f"  Processed intensity: {intensity}")
         print(f"  Default intensity: {config.default_intensity}")
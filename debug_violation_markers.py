@@ -5,20 +5,32 @@ Debug script to investigate violation boundary markers.
 
 import sys
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from bark_detector.legal.database import ViolationDatabase
+from debug_data import load_day
+
+# Boundary marker colors per violation type and the charted window, as in pdf_generator.py
+VIOLATION_COLORS = {"Continuous": '#DC2626'}
+DEFAULT_VIOLATION_COLOR = '#F59E0B'  # Intermittent
+WINDOW_START_HOUR, WINDOW_END_HOUR = 6, 20
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(ts: str) -> datetime:
+    """Parse an ISO timestamp, treating a trailing 'Z' as UTC (cached: events often share a second)."""
+    if ts.endswith('Z'):
+        return datetime.fromisoformat(ts[:-1]).replace(tzinfo=timezone.utc)
+    return datetime.fromisoformat(ts)
 
 def investigate_violation_boundaries():
     """Investigate violation boundary events and their processing."""
 
     # Load the data for 2025-09-23
-    violation_db = ViolationDatabase()
-    violations = violation_db.load_violations_new("2025-09-23")
-    bark_events = violation_db.load_events("2025-09-23")
+    violations, bark_events = load_day("2025-09-23")
 
     target_id = "8fdaba48-428a-411e-b1ad-42084ad43c0e"
 
@@ -43,13 +55,13 @@ def investigate_violation_boundaries():
     print(f"Event IDs in violation: {len(target_violation.barkEventIds)}")
 
     # Get all events for this violation, sorted by time
-    violation_events = []
-    for event in bark_events:
-        if event.bark_id in target_violation.barkEventIds:
-            violation_events.append(event)
+    # Look the violation's IDs up in an ID index instead of scanning every event
+    bark_events_by_id = {event.bark_id: event for event in bark_events}
+    violation_events = [bark_events_by_id[bark_id] for bark_id in dict.fromkeys(target_violation.barkEventIds)
+                        if bark_id in bark_events_by_id]
 
     # Sort events by time
-    violation_events.sort(key=lambda e: f"{e.realworld_date}T{e.realworld_time}")
+    violation_events.sort(key=lambda e: (e.realworld_date, e.realworld_time))
 
     print(f"\n--- Violation Events (first 5 and last 5) ---")
     print(f"Total events in violation: {len(violation_events)}")
@@ -68,8 +80,8 @@ def investigate_violation_boundaries():
         print(f"  {idx}. {event.realworld_time} - ID: {event.bark_id[:8]}... - Intensity: {event.intensity:.6f} {is_target}")
 
     # Parse violation timestamps to get exact times
-    start_dt = datetime.fromisoformat(target_violation.startTimestamp.replace('Z', '+00:00'))
-    end_dt = datetime.fromisoformat(target_violation.endTimestamp.replace('Z', '+00:00'))
+    start_dt = _parse_timestamp(target_violation.startTimestamp)
+    end_dt = _parse_timestamp(target_violation.endTimestamp)
 
     start_hour = start_dt.hour + start_dt.minute / 60
     end_hour = end_dt.hour + end_dt.minute / 60
@@ -79,9 +91,8 @@ def investigate_violation_boundaries():
     print(f"Violation end time: {end_dt.strftime('%H:%M:%S')} (hour: {end_hour:.3f})")
 
     # Check if target event time matches violation start time
-    target_event = next(e for e in violation_events if e.bark_id == target_id)
-    target_time = f"{target_event.realworld_date}T{target_event.realworld_time}.000Z"
-    target_dt = datetime.fromisoformat(target_time)
+    target_event = bark_events_by_id[target_id]
+    target_dt = _parse_timestamp(f"{target_event.realworld_date}T{target_event.realworld_time}+00:00")
 
     print(f"\nTarget event time: {target_dt.strftime('%H:%M:%S')}")
     print(f"Is target event at violation start? {target_dt == start_dt}")
@@ -91,14 +102,13 @@ def investigate_violation_boundaries():
     print(f"\n--- Boundary Markers (axvline commands) ---")
     print(f"These are FULL HEIGHT lines from y=0 to y=1.0:")
 
-    # Simulate the boundary marker logic from pdf_generator.py
-    if 6 <= start_hour <= 20:  # Within 6am-8pm window
-        plot_start = max(6, start_hour)
-        color = '#DC2626' if target_violation.type == "Continuous" else '#F59E0B'
+    # Simulate the boundary marker logic from pdf_generator.py: violations overlapping the
+    # 6am-8pm window get markers clipped to it
+    if start_hour <= WINDOW_END_HOUR and end_hour >= WINDOW_START_HOUR:
+        plot_start = max(WINDOW_START_HOUR, start_hour)
+        plot_end = min(WINDOW_END_HOUR, end_hour)
+        color = VIOLATION_COLORS.get(target_violation.type, DEFAULT_VIOLATION_COLOR)
         print(f"  Start marker: ax.axvline(x={plot_start:.3f}, color='{color}', alpha=0.6, linewidth=2.5)")
-
-    if 6 <= end_hour <= 20:  # Within 6am-8pm window
-        plot_end = min(20, end_hour)
         if plot_end != plot_start:
             print(f"  End marker: ax.axvline(x={plot_end:.3f}, color='{color}', alpha=0.6, linewidth=2.5)")
 
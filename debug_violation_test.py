@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
 """Debug script to test violation detection algorithm"""
 
+# Disable numba to see pure Python execution. This has to happen before anything
+# imports numba (librosa does, via the tracker), or the JIT is already configured
+import os
+os.environ['NUMBA_DISABLE_JIT'] = '1'
+
 import sys
+assert 'numba' not in sys.modules, "numba was imported before NUMBA_DISABLE_JIT was set"
 sys.path.insert(0, '/Users/zand/dev/bark_detector')
 
 from bark_detector.legal.tracker import LegalViolationTracker
@@ -15,10 +21,6 @@ import logging
 # Enable logging
 logging.basicConfig(level=logging.DEBUG, format='%(name)s - %(levelname)s - %(message)s')
 
-# Disable numba to see pure Python execution
-import os
-os.environ['NUMBA_DISABLE_JIT'] = '1'
-
 # Create test setup
 tracker = LegalViolationTracker(interactive=False)
 mock_detector = Mock()
@@ -26,26 +28,13 @@ mock_detector.sample_rate = 16000
 mock_detector.session_gap_threshold = 10.0
 mock_detector.analysis_sensitivity = 0.30
 
-# Create mock bark events for continuous violation (≤10s gaps, ≥5min session)
+# Create mock bark events for continuous violation (≤10s gaps, ≥5min session):
+# 10s barks with 5s gaps up to 100s, then 10s gaps (the max allowed) up to 320s.
+# Session duration: 320-10 = 310s = 5.17min > 5min threshold
+event_starts = list(range(10, 101, 15)) + list(range(120, 321, 20))
 mock_bark_events = [
-    BarkEvent(start_time=10.0, end_time=20.0, confidence=0.8, triggering_classes=["Bark"]),   # Event 1
-    BarkEvent(start_time=25.0, end_time=35.0, confidence=0.8, triggering_classes=["Bark"]),   # Event 2 (5s gap)
-    BarkEvent(start_time=40.0, end_time=50.0, confidence=0.8, triggering_classes=["Bark"]),   # Event 3 (5s gap)
-    BarkEvent(start_time=55.0, end_time=65.0, confidence=0.8, triggering_classes=["Bark"]),   # Event 4 (5s gap)
-    BarkEvent(start_time=70.0, end_time=80.0, confidence=0.8, triggering_classes=["Bark"]),   # Event 5 (5s gap)
-    BarkEvent(start_time=85.0, end_time=95.0, confidence=0.8, triggering_classes=["Bark"]),   # Event 6 (5s gap)
-    BarkEvent(start_time=100.0, end_time=110.0, confidence=0.8, triggering_classes=["Bark"]), # Event 7 (5s gap)
-    BarkEvent(start_time=120.0, end_time=130.0, confidence=0.8, triggering_classes=["Bark"]), # Event 8 (10s gap - max allowed)
-    BarkEvent(start_time=140.0, end_time=150.0, confidence=0.8, triggering_classes=["Bark"]), # Event 9 (10s gap)
-    BarkEvent(start_time=160.0, end_time=170.0, confidence=0.8, triggering_classes=["Bark"]), # Event 10 (10s gap)
-    BarkEvent(start_time=180.0, end_time=190.0, confidence=0.8, triggering_classes=["Bark"]), # Event 11 (10s gap)
-    BarkEvent(start_time=200.0, end_time=210.0, confidence=0.8, triggering_classes=["Bark"]), # Event 12 (10s gap)
-    BarkEvent(start_time=220.0, end_time=230.0, confidence=0.8, triggering_classes=["Bark"]), # Event 13 (10s gap)
-    BarkEvent(start_time=240.0, end_time=250.0, confidence=0.8, triggering_classes=["Bark"]), # Event 14 (10s gap)
-    BarkEvent(start_time=260.0, end_time=270.0, confidence=0.8, triggering_classes=["Bark"]), # Event 15 (10s gap)
-    BarkEvent(start_time=280.0, end_time=290.0, confidence=0.8, triggering_classes=["Bark"]), # Event 16 (10s gap)
-    BarkEvent(start_time=300.0, end_time=310.0, confidence=0.8, triggering_classes=["Bark"]), # Event 17 (10s gap)
-    BarkEvent(start_time=320.0, end_time=330.0, confidence=0.8, triggering_classes=["Bark"]), # Event 18 (10s gap) - Session duration: 320-10 = 310s = 5.17min > 5min threshold
+    BarkEvent(start_time=float(start), end_time=start + 10.0, confidence=0.8, triggering_classes=["Bark"])
+    for start in event_starts
 ]
 
 def debug_mock_method(audio_data, sensitivity):
@@ -1,3 +1,5 @@
+import matplotlib
+matplotlib.use('Agg')  # Rendering to PNG only; skips GUI backend selection
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from reportlab.lib.pagesizes import letter
@@ -8,8 +10,12 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from datetime import datetime, timedelta
 import io
+import re
 import numpy as np
 
+# Violation durations look like "123m 50s"
+DURATION_RE = re.compile(r'(\d+)m\s*(\d+)s')
+
 # Sample data extracted from the original report
 violations_data = [
     {"id": 1, "type": "Constant", "start": "10:40:53", "end": "10:46:42", "duration": "5m 48s", "barks": 77, "files": 1},
@@ -21,45 +27,46 @@ violations_data = [
     {"id": 7, "type": "Intermittent", "start": "17:05:04", "end": "17:41:27", "duration": "36m 22s", "barks": 97, "files": 14}
 ]
 
+_timeline_fig = None
+_timeline_ax = None
+
+def _get_timeline_axes():
+    """Return the timeline figure and cleared axes, created on first use and reused across reports"""
+    global _timeline_fig, _timeline_ax
+    if _timeline_fig is None:
+        _timeline_fig, _timeline_ax = plt.subplots(figsize=(12, 6))
+    else:
+        _timeline_ax.cla()
+    return _timeline_fig, _timeline_ax
+
 def create_timeline_chart():
     """Create a professional timeline chart showing bark activity over 24 hours"""
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = _get_timeline_axes()
     fig.patch.set_facecolor('white')
     
-    # Create time data points for each violation
-    times = []
-    intensities = []
-    colors_list = []
-    
-    for violation in violations_data:
-        # Parse start and end times
-        start_hour = int(violation["start"].split(":")[0])
-        start_min = int(violation["start"].split(":")[1])
-        end_hour = int(violation["end"].split(":")[0])
-        end_min = int(violation["end"].split(":")[1])
-        
-        start_decimal = start_hour + start_min/60
-        end_decimal = end_hour + end_min/60
-        
-        # Create multiple points across the violation duration
-        duration_hours = end_decimal - start_decimal
-        num_points = max(3, int(duration_hours * 4))  # More points for longer violations
-        
-        for i in range(num_points):
-            time_point = start_decimal + (duration_hours * i / (num_points - 1))
-            times.append(time_point)
-            
-            # Intensity based on barks per minute
-            duration_minutes = duration_hours * 60
-            barks_per_minute = violation["barks"] / duration_minutes if duration_minutes > 0 else 0
-            intensity = min(1.0, barks_per_minute / 10)  # Normalize to 0-1 scale
-            intensities.append(intensity)
-            
-            # Color coding
-            if violation["type"] == "Constant":
-                colors_list.append('#DC2626')  # Red
-            else:
-                colors_list.append('#F59E0B')  # Orange
+    # Per-violation start/end as decimal hours (times are zero-padded HH:MM:SS)
+    starts = np.array([int(v["start"][0:2]) + int(v["start"][3:5]) / 60 for v in violations_data])
+    ends = np.array([int(v["end"][0:2]) + int(v["end"][3:5]) / 60 for v in violations_data])
+    barks = np.array([v["barks"] for v in violations_data], dtype=float)
+    types = np.array([v["type"] for v in violations_data])
+    
+    # Create multiple points across each violation's duration
+    duration_hours = ends - starts
+    num_points = np.maximum(3, (duration_hours * 4).astype(int))  # More points for longer violations
+    
+    # Intensity based on barks per minute, normalized to 0-1 scale
+    duration_minutes = duration_hours * 60
+    barks_per_minute = np.divide(barks, duration_minutes, out=np.zeros_like(barks), where=duration_minutes > 0)
+    intensity = np.minimum(1.0, barks_per_minute / 10)
+    
+    # Color coding: red for constant, orange for intermittent
+    violation_colors = np.where(types == "Constant", '#DC2626', '#F59E0B')
+    
+    # Expand to one entry per point: point i of a violation sits i/(n-1) of the way through it
+    point_index = np.arange(num_points.sum()) - np.repeat(np.cumsum(num_points) - num_points, num_points)
+    times = np.repeat(starts, num_points) + np.repeat(duration_hours, num_points) * point_index / np.repeat(num_points - 1, num_points)
+    intensities = np.repeat(intensity, num_points)
+    colors_list = np.repeat(violation_colors, num_points)
     
     # Create scatter plot
     scatter = ax.scatter(times, intensities, c=colors_list, s=60, alpha=0.7, edgecolors='white', linewidth=0.5)
@@ -88,13 +95,12 @@ def create_timeline_chart():
     ax.legend(handles=legend_elements, loc='upper right', frameon=True, fancybox=True, shadow=True)
     
     # Tight layout
-    plt.tight_layout()
+    fig.tight_layout()
     
-    # Save to bytes buffer
+    # Save to bytes buffer (the figure stays open for the next report)
     buffer = io.BytesIO()
-    plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight', facecolor='white')
+    fig.savefig(buffer, format='png', dpi=300, bbox_inches='tight', facecolor='white')
     buffer.seek(0)
-    plt.close()
     
     return buffer
 
@@ -161,11 +167,8 @@ def create_pdf_report():
     intermittent_violations = sum(1 for v in violations_data if v["type"] == "Intermittent")
     
     # Calculate total duration
-    total_minutes = sum([
-        int(v["duration"].split("m")[0]) + 
-        (int(v["duration"].split("m")[1].replace("s", "").strip()) / 60) 
-        for v in violations_data
-    ])
+    durations = (DURATION_RE.match(v["duration"]) for v in violations_data)
+    total_minutes = sum(int(m[1]) * 60 + int(m[2]) for m in durations) / 60
     total_hours = int(total_minutes // 60)
     remaining_minutes = int(total_minutes % 60)
     
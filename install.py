@@ -8,10 +8,12 @@ import platform
 import subprocess
 import sys
 import os
+from functools import lru_cache
 
 
+@lru_cache(maxsize=None)
 def get_platform_info():
-    """Get platform information."""
+    """Get platform information (cached; it can't change while the script runs)."""
     system = platform.system()
     machine = platform.machine()
     python_version = platform.python_version()
@@ -43,7 +45,7 @@ def install_requirements():
     print(f"Python version: {python_version}")
     
     # Check Python version compatibility
-    major, minor = map(int, python_version.split('.')[:2])
+    major, minor = sys.version_info[:2]
     if major < 3 or (major == 3 and minor < 9):
         print(f"❌ Error: Python {python_version} is not supported. Please use Python 3.9-3.11")
         return False
@@ -69,12 +71,13 @@ def install_requirements():
         print(f"Error: {requirements_file} not found!")
         return False
     
-    # Install using uv
+    # Install using uv; its output goes straight to the terminal so progress
+    # (and any resolver error) is shown live rather than buffered
     try:
         print(f"Installing dependencies from {requirements_file}...")
-        result = subprocess.run([
+        subprocess.run([
             "uv", "add", "-r", requirements_file
-        ], check=True, capture_output=True, text=True)
+        ], check=True)
         
         print("✅ Dependencies installed successfully!")
         print("\nTo run the bark detector:")
@@ -83,16 +86,15 @@ def install_requirements():
         
     except subprocess.CalledProcessError as e:
         print(f"❌ Primary installation failed: {e}")
-        print(f"stderr: {e.stderr}")
         
         # Try fallback requirements
         fallback_file = "requirements-fallback.txt"
         if os.path.exists(fallback_file):
             print(f"\n🔄 Trying fallback installation with {fallback_file}...")
             try:
-                result = subprocess.run([
+                subprocess.run([
                     "uv", "add", "-r", fallback_file
-                ], check=True, capture_output=True, text=True)
+                ], check=True)
                 
                 print("✅ Fallback installation successful!")
                 print("\nTo run the bark detector:")
@@ -101,7 +103,6 @@ def install_requirements():
                 
             except subprocess.CalledProcessError as e2:
                 print(f"❌ Fallback installation also failed: {e2}")
-                print(f"stderr: {e2.stderr}")
         
         return False
     except FileNotFoundError:
@@ -14,6 +14,7 @@ Usage:
 import argparse
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any
 import sys
@@ -21,12 +22,67 @@ import sys
 # Add the project root to the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from bark_detector.core.models import GroundTruthEvent, seconds_to_timestamp, detect_timestamp_format
+from bark_detector.core.models import (
+    GroundTruthEvent, seconds_to_timestamp, detect_timestamp_format, timestamp_to_seconds
+)
+
+# Optional fast JSON parsing/serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Ground truth events often repeat the same timestamp strings
+cached_timestamp_to_seconds = lru_cache(maxsize=4096)(timestamp_to_seconds)
+
+
+def load_json_file(file_path: Path) -> Any:
+    """Load a JSON file, using orjson when it is installed."""
+    with open(file_path, 'rb') as f:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(f.read())
+        return json.load(f)
+
+
+def write_json_file(file_path: Path, data: Any) -> None:
+    """Write data as JSON indented by 2 spaces, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+def numeric_to_seconds(value: Any) -> float:
+    """Convert a numeric (decimal seconds) timestamp, rejecting strings."""
+    if isinstance(value, str):
+        raise ValueError(f"Not a numeric timestamp: {value}")
+    return float(value)
+
+
+def timestamp_value_to_seconds(value: Any) -> float:
+    """Detect the format of a timestamp and convert it to decimal seconds."""
+    if detect_timestamp_format(value) == "seconds":
+        return float(value)
+    return cached_timestamp_to_seconds(value)
+
+
+def select_timestamp_converter(value: Any):
+    """Pick a converter specialized for the format of a sample timestamp.
+
+    The converter raises when handed a value in another format, so callers can
+    fall back to timestamp_value_to_seconds for that value.
+    """
+    if isinstance(value, (int, float)):
+        return numeric_to_seconds
+    return cached_timestamp_to_seconds
+
 
 def validate_and_fix_ground_truth_data(data: Dict[str, Any], audio_file_path: Path) -> Dict[str, Any]:
     """Validate and fix ground truth data quality issues.
@@ -47,27 +103,27 @@ def validate_and_fix_ground_truth_data(data: Dict[str, Any], audio_file_path: Pa
     fixed_events = []
     issues_found = 0
     
+    # Timestamps within a file almost always share one format, so detect it once
+    # from the first event and only re-detect values the specialized converter rejects
+    first_event = events[0] if events else {}
+    start_to_seconds = select_timestamp_converter(first_event.get('start_time'))
+    end_to_seconds = select_timestamp_converter(first_event.get('end_time'))
+    
     for i, event in enumerate(events):
         start_time = event.get('start_time')
         end_time = event.get('end_time')
         
-        # Detect and convert formats
+        # Convert to float for validation
         try:
-            start_format = detect_timestamp_format(start_time)
-            end_format = detect_timestamp_format(end_time)
-            
-            # Convert to float for validation
-            if start_format == "seconds":
-                start_seconds = float(start_time)
-            else:
-                from bark_detector.core.models import timestamp_to_seconds
-                start_seconds = timestamp_to_seconds(start_time)
+            try:
+                start_seconds = start_to_seconds(start_time)
+            except (ValueError, TypeError, AttributeError):
+                start_seconds = timestamp_value_to_seconds(start_time)
                 
-            if end_format == "seconds":
-                end_seconds = float(end_time)
-            else:
-                from bark_detector.core.models import timestamp_to_seconds
-                end_seconds = timestamp_to_seconds(end_time)
+            try:
+                end_seconds = end_to_seconds(end_time)
+            except (ValueError, TypeError, AttributeError):
+                end_seconds = timestamp_value_to_seconds(end_time)
             
         except (ValueError, TypeError) as e:
             logger.warning(f"  Event {i+1}: Invalid timestamp format - {e}")
@@ -141,8 +197,7 @@ def convert_ground_truth_file(file_path: Path, dry_run: bool = False) -> bool:
     
     try:
         # Load existing data
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        data = load_json_file(file_path)
         
         # Get audio file path for validation
         audio_file = data.get('audio_file', '')
@@ -162,13 +217,11 @@ def convert_ground_truth_file(file_path: Path, dry_run: bool = False) -> bool:
             # Create backup
             backup_path = file_path.with_suffix(f"{file_path.suffix}.backup")
             if not backup_path.exists():
-                with open(backup_path, 'w') as f:
-                    json.dump(data, f, indent=2)
+                write_json_file(backup_path, data)
                 logger.info(f"  Backup created: {backup_path.name}")
             
             # Write fixed data
-            with open(file_path, 'w') as f:
-                json.dump(fixed_data, f, indent=2)
+            write_json_file(file_path, fixed_data)
             logger.info(f"  ✅ Converted successfully")
         else:
             logger.info(f"  ✅ Would convert (dry run)")
@@ -12,11 +12,45 @@ import logging
 import re
 import shutil
 import sys
+from contextlib import ExitStack
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, NamedTuple, Set
+from typing import Dict, Iterable, Iterator, List, Optional, NamedTuple, Set, Tuple
 from dataclasses import dataclass, asdict
 
+# Optional fast JSON serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional Aho-Corasick keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Standard Python logging format: "YYYY-MM-DD HH:MM:SS,mmm - LEVEL - MESSAGE".
+# Compiled once; match() anchors at the start and the stripped line has no
+# newline, so neither ^ nor $ is needed.
+LOG_LINE_RE = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) - (\w+) - (.*)', re.ASCII)
+
+
+def parse_log_timestamp(timestamp_str: str) -> datetime:
+    """
+    Parse a "YYYY-MM-DD HH:MM:SS,mmm" timestamp already validated by LOG_LINE_RE.
+
+    The fields sit at fixed offsets, so they are sliced directly instead of going
+    through strptime. Raises ValueError for out-of-range values (e.g. month 13).
+    """
+    return datetime(
+        int(timestamp_str[0:4]), int(timestamp_str[5:7]), int(timestamp_str[8:10]),
+        int(timestamp_str[11:13]), int(timestamp_str[14:16]), int(timestamp_str[17:19]),
+        int(timestamp_str[20:23]) * 1000
+    )
+
 
 class LogEntry(NamedTuple):
     """Structured representation of a log entry."""
@@ -58,6 +92,12 @@ class LogMigrator:
         "violation report", "enhanced report", "csv export"
     ]
 
+    # Any analysis keyword, matched in one case-insensitive scan of the message
+    ANALYSIS_RE = re.compile('|'.join(map(re.escape, ANALYSIS_KEYWORDS)), re.IGNORECASE)
+
+    # Size hint for each readlines() batch when parsing the log
+    READ_CHUNK_BYTES = 1 << 20
+
     def __init__(self, logs_dir: str = "logs", backup_dir: Optional[str] = None,
                  continue_on_error: bool = False, batch_size: int = 1000,
                  verbose: bool = False):
@@ -77,6 +117,16 @@ class LogMigrator:
         self.batch_size = batch_size
         self.verbose = verbose
 
+        # With pyahocorasick installed, analysis keywords are found with an
+        # Aho-Corasick automaton: one linear pass over the message however many
+        # keywords there are. Otherwise ANALYSIS_RE is used.
+        self._analysis_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._analysis_automaton = ahocorasick.Automaton()
+            for keyword in self.ANALYSIS_KEYWORDS:
+                self._analysis_automaton.add_word(keyword, keyword)
+            self._analysis_automaton.make_automaton()
+
         # Statistics
         self.total_lines = 0
         self.malformed_lines = 0
@@ -146,10 +196,7 @@ class LogMigrator:
         if not line:
             return None
 
-        # Regex pattern for standard Python logging format
-        pattern = r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) - (\w+) - (.*)$'
-
-        match = re.match(pattern, line)
+        match = LOG_LINE_RE.match(line)
         if not match:
             self.malformed_lines += 1
             warning = f"Line {line_number}: Malformed timestamp format - skipped"
@@ -163,8 +210,8 @@ class LogMigrator:
         timestamp_str, level, message = match.groups()
 
         try:
-            # Parse timestamp - handle microseconds as milliseconds
-            timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S,%f')
+            # Parse timestamp - milliseconds become microseconds
+            timestamp = parse_log_timestamp(timestamp_str)
         except ValueError as e:
             self.malformed_lines += 1
             warning = f"Line {line_number}: Invalid timestamp format - skipped"
@@ -189,39 +236,45 @@ class LogMigrator:
         Returns:
             str: 'detection' or 'analysis'
         """
-        message_lower = log_entry.message.lower()
-
-        # Check analysis keywords first (more specific)
-        for keyword in self.ANALYSIS_KEYWORDS:
-            if keyword in message_lower:
-                return 'analysis'
+        # Analysis keywords take precedence (more specific). Messages with detection
+        # keywords and unmatched messages (default fallback) both go to detection,
+        # so DETECTION_KEYWORDS never need to be scanned.
+        if self._analysis_automaton is not None:
+            is_analysis = next(self._analysis_automaton.iter(log_entry.message.lower()), None) is not None
+        else:
+            is_analysis = self.ANALYSIS_RE.search(log_entry.message) is not None
 
-        # Check detection keywords
-        for keyword in self.DETECTION_KEYWORDS:
-            if keyword in message_lower:
-                return 'detection'
+        if is_analysis:
+            return 'analysis'
 
-        # Default fallback to detection channel
         return 'detection'
 
-    def parse_log_file(self, input_file: Path) -> List[LogEntry]:
-        """Parse entire log file into structured entries."""
-        entries = []
-
+    def iter_log_entries(self, input_file: Path) -> Iterator[LogEntry]:
+        """Parse a log file lazily, yielding a structured entry for each valid line."""
         self.logger.info(f"Parsing log file: {input_file}")
 
+        parse_log_line = self.parse_log_line
+        line_number = 0
+
         with open(input_file, 'r', encoding='utf-8') as f:
-            for line_number, line in enumerate(f, 1):
-                self.total_lines += 1
+            # Read ~1 MiB of lines at a time so the per-line loop carries no progress
+            # bookkeeping; progress is reported once per chunk instead
+            while True:
+                lines = f.readlines(self.READ_CHUNK_BYTES)
+                if not lines:
+                    break
 
-                entry = self.parse_log_line(line, line_number)
-                if entry:
-                    entries.append(entry)
+                for line_number, line in enumerate(lines, line_number + 1):
+                    entry = parse_log_line(line, line_number)
+                    if entry:
+                        yield entry
 
-                # Progress reporting for large files
-                if self.total_lines % 1000 == 0:
-                    self.logger.info(f"Processed {self.total_lines} lines...")
+                self.total_lines += len(lines)
+                self.logger.info(f"Processed {self.total_lines} lines...")
 
+    def parse_log_file(self, input_file: Path) -> List[LogEntry]:
+        """Parse entire log file into structured entries."""
+        entries = list(self.iter_log_entries(input_file))
         self.logger.info(f"Parsed {len(entries)} valid entries from {self.total_lines} total lines")
         return entries
 
@@ -240,6 +293,70 @@ class LogMigrator:
 
         return grouped
 
+    def count_by_date_and_channel(self, entries: Iterable[LogEntry]) -> Dict[str, Dict[str, int]]:
+        """Count entries per date and channel without keeping the entries."""
+        counts = {}
+
+        for entry in entries:
+            date_str = entry.timestamp.date().isoformat()
+            channel = self.classify_by_channel(entry)
+
+            if date_str not in counts:
+                counts[date_str] = {'detection': 0, 'analysis': 0}
+
+            counts[date_str][channel] += 1
+
+        return counts
+
+    def stream_daily_channel_logs(self, entries: Iterable[LogEntry]) -> Tuple[Dict[str, Dict[str, int]], List[str]]:
+        """
+        Write entries straight to their daily channel log files in a single pass.
+
+        Each (date, channel) file is opened on its first entry, so memory use does not
+        grow with the log size. Files are written under a ".migrating" name and only
+        renamed into place once every entry is written; if parsing fails part-way the
+        partial files are removed and existing daily logs are left untouched.
+
+        Returns:
+            (entry counts per date and channel, output files created)
+        """
+        counts = {}
+        handles = {}
+
+        with ExitStack() as stack:
+            try:
+                for entry in entries:
+                    date_str = entry.timestamp.date().isoformat()
+                    channel = self.classify_by_channel(entry)
+
+                    handle = handles.get((date_str, channel))
+                    if handle is None:
+                        date_dir = self.logs_dir / date_str
+                        date_dir.mkdir(parents=True, exist_ok=True)
+                        temp_file = date_dir / f"{date_str}_{channel}.log.migrating"
+                        handle = stack.enter_context(open(temp_file, 'w', encoding='utf-8'))
+                        handles[(date_str, channel)] = handle
+                        counts.setdefault(date_str, {'detection': 0, 'analysis': 0})
+
+                    handle.write(entry.original_line + '\n')
+                    counts[date_str][channel] += 1
+            except BaseException:
+                stack.close()
+                for handle in handles.values():
+                    Path(handle.name).unlink(missing_ok=True)
+                raise
+
+        output_files = []
+        for (date_str, channel), handle in handles.items():
+            temp_file = Path(handle.name)
+            log_file = temp_file.with_suffix('')  # Drop ".migrating"
+            temp_file.replace(log_file)
+
+            output_files.append(str(log_file))
+            self.logger.info(f"Created {log_file} with {counts[date_str][channel]} entries")
+
+        return counts, output_files
+
     def write_daily_channel_logs(self, date: str, entries_by_channel: Dict[str, List[LogEntry]]) -> List[str]:
         """Write daily channel log files."""
         output_files = []
@@ -262,24 +379,24 @@ class LogMigrator:
 
         return output_files
 
-    def generate_summary(self, backup_path: Path, grouped_entries: Dict[str, Dict[str, List[LogEntry]]],
+    def generate_summary(self, backup_path: Path, grouped_counts: Dict[str, Dict[str, int]],
                         output_files: List[str]) -> MigrationSummary:
-        """Generate migration summary."""
+        """Generate migration summary from entry counts per date and channel."""
         classification_stats = {
             'detection_entries': 0,
             'analysis_entries': 0,
             'unclassified_entries': 0
         }
 
-        dates = list(grouped_entries.keys())
+        dates = list(grouped_counts.keys())
         date_range = {
             'earliest_date': min(dates) if dates else '',
             'latest_date': max(dates) if dates else ''
         }
 
-        for date_entries in grouped_entries.values():
-            classification_stats['detection_entries'] += len(date_entries['detection'])
-            classification_stats['analysis_entries'] += len(date_entries['analysis'])
+        for date_counts in grouped_counts.values():
+            classification_stats['detection_entries'] += date_counts['detection']
+            classification_stats['analysis_entries'] += date_counts['analysis']
 
         return MigrationSummary(
             migration_timestamp=datetime.now(timezone.utc).isoformat(),
@@ -313,37 +430,39 @@ class LogMigrator:
         # 1. Input Validation
         self.validate_input_file(input_file)
 
-        # 2. Parse and Classify
-        log_entries = self.parse_log_file(input_file)
-        grouped_entries = self.group_by_date_and_channel(log_entries)
-
         if dry_run:
+            # 2. Parse and Classify (counts only)
+            grouped_counts = self.count_by_date_and_channel(self.iter_log_entries(input_file))
+
             self.logger.info("DRY RUN: Migration preview:")
-            for date, channels in grouped_entries.items():
-                for channel, entries in channels.items():
-                    if entries:
+            for date, channels in grouped_counts.items():
+                for channel, count in channels.items():
+                    if count:
                         output_file = f"{self.logs_dir}/{date}/{date}_{channel}.log"
-                        self.logger.info(f"  Would create: {output_file} ({len(entries)} entries)")
+                        self.logger.info(f"  Would create: {output_file} ({count} entries)")
 
             # Return preview summary without creating files
-            return self.generate_summary(input_file, grouped_entries, [])
+            return self.generate_summary(input_file, grouped_counts, [])
 
         # 3. Create Backup
         backup_path = self.create_backup(input_file)
 
-        # 4. Write Output Files
-        output_files = []
-        for date, channels in grouped_entries.items():
-            files_for_date = self.write_daily_channel_logs(date, channels)
-            output_files.extend(files_for_date)
+        # 2+4. Parse, Classify and Write Output Files in one streaming pass
+        grouped_counts, output_files = self.stream_daily_channel_logs(self.iter_log_entries(input_file))
+        valid_entries = sum(sum(channels.values()) for channels in grouped_counts.values())
+        self.logger.info(f"Parsed {valid_entries} valid entries from {self.total_lines} total lines")
 
         # 5. Generate Summary
-        summary = self.generate_summary(backup_path, grouped_entries, output_files)
+        summary = self.generate_summary(backup_path, grouped_counts, output_files)
 
         # 6. Write Summary JSON
         summary_file = self.logs_dir / f"migration_summary_{datetime.now().strftime('%Y-%m-%dT%H:%M:%S')}.json"
-        with open(summary_file, 'w') as f:
-            json.dump(asdict(summary), f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(summary_file, 'wb') as f:
+                f.write(orjson.dumps(asdict(summary), option=orjson.OPT_INDENT_2))
+        else:
+            with open(summary_file, 'w') as f:
+                json.dump(asdict(summary), f, indent=2)
 
         self.logger.info(f"Migration summary written to: {summary_file}")
         self.logger.info(f"Migration completed successfully!")
@@ -5,36 +5,27 @@ Test script to generate the actual graph and inspect intensity values.
 
 import sys
 from pathlib import Path
-from datetime import datetime
-import matplotlib
-matplotlib.use('Agg')  # Use non-GUI backend
-import matplotlib.pyplot as plt
 
 # Add current directory to path to import bark_detector modules
 sys.path.insert(0, str(Path(__file__).parent))
 
 from bark_detector.utils.pdf_generator import PDFGenerationService, PDFConfig
-from bark_detector.legal.database import ViolationDatabase
+from debug_data import load_day
 
 def test_activity_timeline_generation():
     """Test the activity timeline generation and print intensity values."""
 
     # Load the data for 2025-09-23
-    violation_db = ViolationDatabase()
-    violations = violation_db.load_violations_new("2025-09-23")
-    bark_events = violation_db.load_events("2025-09-23")
+    violations, bark_events = load_day("2025-09-23")
 
     print(f"Loaded {len(violations)} violations and {len(bark_events)} events")
 
     # Create PDF service and config
     config = PDFConfig()
 
-    # Create mapping of bark events to violation types for color coding (copied from pdf_generator.py)
-    bark_event_colors = {}
-    for violation in violations:
-        color = '#DC2626' if violation.type == "Continuous" else '#F59E0B'  # Red for continuous, orange for intermittent
-        for bark_id in violation.barkEventIds:
-            bark_event_colors[bark_id] = color
+    # Bark event IDs per violation type for color coding
+    continuous_ids = {bid for v in violations if v.type == "Continuous" for bid in v.barkEventIds}
+    intermittent_ids = {bid for v in violations if v.type != "Continuous" for bid in v.barkEventIds}
 
     # Track our target event
     target_id = "8fdaba48-428a-411e-b1ad-42084ad43c0e"
@@ -45,22 +36,23 @@ def test_activity_timeline_generation():
 
     # Process events (copied logic from _generate_activity_timeline)
     for event in bark_events:
-        # Parse event timestamp
-        event_dt = datetime.fromisoformat(f"{event.realworld_date}T{event.realworld_time}.000Z")
-        event_hour = event_dt.hour + event_dt.minute / 60
+        # Hour and minute from the zero-padded HH:MM:SS event time
+        t = event.realworld_time
+        event_hour = int(t[0:2]) + int(t[3:5]) / 60
 
         # Only process events within 6am-8pm window
         if 6 <= event_hour <= 20:
             event_count += 1
 
             # Determine color based on violation association
-            color = bark_event_colors.get(event.bark_id, '#9CA3AF')  # Gray for non-violation events
+            # Red for continuous, orange for intermittent, gray for non-violation events
+            color = ('#DC2626' if event.bark_id in continuous_ids
+                     else '#F59E0B' if event.bark_id in intermittent_ids
+                     else '#9CA3AF')
 
             # Process intensity (exact logic from pdf_generator.py)
-            intensity = getattr(event, 'intensity', config.default_intensity)
             # Use default intensity if intensity is 0.0 (missing/invalid data)
-            if intensity == 0.0:
-                intensity = config.default_intensity
+            intensity = event.intensity or config.default_intensity
 
             # Check if this is our target event
             if event.bark_id == target_id:
@@ -72,7 +64,7 @@ def test_activity_timeline_generation():
                 print(f"  Raw intensity: {event.intensity}")
                 print(f"  Processed intensity: {intensity}")
                 print(f"  Color: {color}")
-                print(f"  In violation? {event.bark_id in bark_event_colors}")
+                print(f"  In violation? {event.bark_id in continuous_ids or event.bark_id in intermittent_ids}")
 
             # Print first few events for debugging
             if event_count <= 5:
@@ -10,15 +10,13 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from bark_detector.utils.pdf_generator import PDFConfig
-from bark_detector.legal.database import ViolationDatabase
+from debug_data import load_day
 
 def test_intensity_logic():
     """Test the intensity processing logic."""
 
     # Load the data
-    violation_db = ViolationDatabase()
-    violations = violation_db.load_violations_new("2025-09-23")
-    bark_events = violation_db.load_events("2025-09-23")
+    violations, bark_events = load_day("2025-09-23")
 
     config = PDFConfig()
     target_id = "8fdaba48-428a-411e-b1ad-42084ad43c0e"
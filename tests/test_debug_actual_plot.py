@@ -0,0 +1,64 @@
+"""Smoke tests for the debug_actual_plot debug script."""
+
+import pytest
+import numpy as np
+
+from bark_detector.legal.database import ViolationDatabase
+from bark_detector.legal.models import PersistedBarkEvent, Violation
+from debug_actual_plot import create_debug_plot
+
+TARGET_ID = "8fdaba48-428a-411e-b1ad-42084ad43c0e"
+TEST_DATE = "2025-09-23"
+
+
+def _make_event(bark_id, realworld_time, intensity):
+    """Bark event on the fixture date."""
+    return PersistedBarkEvent(
+        realworld_date=TEST_DATE,
+        realworld_time=realworld_time,
+        bark_id=bark_id,
+        bark_type="Bark",
+        est_dog_size=None,
+        audio_file_name="test.wav",
+        bark_audiofile_timestamp="00:00:15.267",
+        confidence=0.824,
+        intensity=intensity
+    )
+
+
+class TestCreateDebugPlot:
+    """Test create_debug_plot on a small day of events."""
+
+    @pytest.fixture
+    def project_dir(self, tmp_path, monkeypatch):
+        """Project directory holding one day with the target event in a violation."""
+        db = ViolationDatabase(violations_dir=tmp_path / 'violations')
+        db.save_events([
+            _make_event("other-event", "07:15:00", 0.0),
+            _make_event(TARGET_ID, "09:30:45", 0.6),
+        ], TEST_DATE)
+        db.save_violations_new([Violation(
+            type="Continuous",
+            startTimestamp=f"{TEST_DATE}T09:30:00.000Z",
+            violationTriggerTimestamp=f"{TEST_DATE}T09:35:00.000Z",
+            endTimestamp=f"{TEST_DATE}T09:40:00.000Z",
+            durationMinutes=10.0,
+            violationDurationMinutes=5.0,
+            barkEventIds=[TARGET_ID]
+        )], TEST_DATE)
+
+        # The script loads ./violations and saves its chart to the working directory
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    def test_plot_data_describes_target_event(self, project_dir):
+        """Test the returned plot data holds the target event as it was plotted."""
+        plot_data = create_debug_plot(date=TEST_DATE)
+
+        assert plot_data['id'].tolist() == [TARGET_ID]
+        assert plot_data['time'].tolist() == ["09:30:45"]
+        assert plot_data['hour'].tolist() == [9.5]
+        assert plot_data['raw_intensity'].tolist() == [0.6]
+        assert plot_data['processed_intensity'].tolist() == [0.6]
+        assert plot_data['color'].tolist() == ['#DC2626']
+        assert (project_dir / 'debug_activity_chart.png').exists()
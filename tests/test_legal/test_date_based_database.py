@@ -5,11 +5,40 @@ import json
 import tempfile
 from pathlib import Path
 from datetime import datetime
+from unittest.mock import patch
 
 from bark_detector.legal.database import ViolationDatabase
 from bark_detector.legal.models import ViolationReport, PersistedBarkEvent, Violation
 
 
+def _make_cached_event(test_date, bark_id):
+    """Bark event for the load cache tests."""
+    return PersistedBarkEvent(
+        realworld_date=test_date,
+        realworld_time="06:25:30",
+        bark_id=bark_id,
+        bark_type="Bark",
+        est_dog_size=None,
+        audio_file_name="test.wav",
+        bark_audiofile_timestamp="00:00:15.267",
+        confidence=0.824,
+        intensity=0.375
+    )
+
+
+def _make_cached_violation(test_date, bark_id):
+    """Violation covering a single bark event for the load cache tests."""
+    return Violation(
+        type="Continuous",
+        startTimestamp=f"{test_date}T06:25:00.000Z",
+        violationTriggerTimestamp=f"{test_date}T06:28:00.000Z",
+        endTimestamp=f"{test_date}T06:30:00.000Z",
+        durationMinutes=5.0,
+        violationDurationMinutes=2.0,
+        barkEventIds=[bark_id]
+    )
+
+
 class TestDateBasedViolationDatabase:
     """Test suite for I17 improvement - project-local date-based violation storage."""
     
@@ -790,6 +819,48 @@ class TestNewDatabaseMethods:
             assert events[0].bark_type == "Bark"
             assert events[0].confidence == 0.824
     
+    def test_load_events_iter_filters_by_hour_range(self):
+        """Test load_events_iter only yields events inside the hour window."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            violations_dir = Path(temp_dir) / 'violations'
+            db = ViolationDatabase(violations_dir=violations_dir)
+            
+            test_date = '2025-08-15'
+            date_dir = violations_dir / test_date
+            date_dir.mkdir(parents=True)
+            
+            times = ["05:59:59", "06:00:00", "12:30:00", "20:00:59", "20:01:00", "noon"]
+            test_data = {
+                'events': [
+                    {
+                        'realworld_date': test_date,
+                        'realworld_time': realworld_time,
+                        'bark_id': f"bark_{i:03d}",
+                        'bark_type': "Bark",
+                        'est_dog_size': None,
+                        'audio_file_name': "test.wav",
+                        'bark_audiofile_timestamp': "00:00:15.267",
+                        'confidence': 0.824,
+                        'intensity': 0.375
+                    }
+                    for i, realworld_time in enumerate(times)
+                ]
+            }
+            
+            with open(date_dir / f'{test_date}_events.json', 'w') as f:
+                json.dump(test_data, f)
+            
+            # No window yields the same events as load_events
+            all_events = list(db.load_events_iter(test_date))
+            assert [e.bark_id for e in all_events] == [e.bark_id for e in db.load_events(test_date)]
+            
+            # Window is inclusive and compares hour + minute/60; a malformed time is skipped
+            in_window = list(db.load_events_iter(test_date, hour_range=(6, 20)))
+            assert [e.realworld_time for e in in_window] == ["06:00:00", "12:30:00", "20:00:59"]
+            
+            # Missing file yields nothing
+            assert list(db.load_events_iter('2025-08-16', hour_range=(6, 20))) == []
+    
     def test_save_violations_new_creates_directory_and_file(self):
         """Test save_violations_new creates directory structure and saves violations."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -868,6 +939,38 @@ class TestNewDatabaseMethods:
             assert violations[0].startTimestamp == "2025-08-15T06:25:00.000Z"
             assert len(violations[0].barkEventIds) == 3
     
+    @pytest.mark.parametrize("make_record, save, load, append, record_id", [
+        (_make_cached_event, 'save_events', 'load_events', 'append_events',
+         lambda event: event.bark_id),
+        (_make_cached_violation, 'save_violations_new', 'load_violations_new', 'append_violations',
+         lambda violation: violation.barkEventIds[0]),
+    ], ids=['events', 'violations'])
+    def test_load_reuses_parsed_records_until_file_changes(self, make_record, save, load, append, record_id):
+        """Test loads cache the parsed records of a day and reload after a save or append."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            violations_dir = Path(temp_dir) / 'violations'
+            db = ViolationDatabase(violations_dir=violations_dir)
+            test_date = '2025-08-15'
+            
+            getattr(db, save)([make_record(test_date, "bark_001")], test_date)
+            first = getattr(db, load)(test_date)
+            
+            # Second load comes from the cache: same objects, fresh list
+            with patch('bark_detector.legal.database._load_json') as mock_load:
+                second = getattr(db, load)(test_date)
+                mock_load.assert_not_called()
+            assert second == first
+            assert second is not first
+            assert second[0] is first[0]
+            
+            # Saving invalidates the cached day
+            getattr(db, save)([make_record(test_date, "bark_001"), make_record(test_date, "bark_002")], test_date)
+            assert [record_id(r) for r in getattr(db, load)(test_date)] == ["bark_001", "bark_002"]
+            
+            # Appending invalidates it too
+            getattr(db, append)([make_record(test_date, "bark_003")], test_date)
+            assert [record_id(r) for r in getattr(db, load)(test_date)] == ["bark_001", "bark_002", "bark_003"]
+    
     def test_save_events_empty_list(self):
         """Test save_events handles empty list gracefully."""
         with tempfile.TemporaryDirectory() as temp_dir:
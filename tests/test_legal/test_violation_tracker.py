@@ -796,6 +796,30 @@ class TestLegalViolationTracker:
         violations = tracker._analyze_intermittent_violations_from_events(gap_events)
         assert len(violations) == 0
 
+    def test_analyze_violations_from_events_matches_separate_analyses(self):
+        """Test the combined analysis returns the same constant and intermittent violations."""
+        tracker = LegalViolationTracker(interactive=False)
+
+        # 6 minutes of barking every 5 seconds, then barks every 4 minutes for 20 more minutes
+        base_datetime = datetime(2025, 9, 21, 10, 0, 0)
+        offsets = [i * 5 for i in range(73)] + [360 + i * 240 for i in range(1, 6)]
+        events = [
+            AlgorithmInputEvent(
+                id=f"bark-{i:03d}",
+                startTimestamp=(base_datetime + timedelta(seconds=offset)).isoformat() + ".000Z"
+            )
+            for i, offset in enumerate(offsets)
+        ]
+
+        constant, intermittent = tracker._analyze_violations_from_events(events)
+
+        assert [v.to_dict() for v in constant] == [
+            v.to_dict() for v in tracker._analyze_constant_violations_from_events(events)]
+        assert [v.to_dict() for v in intermittent] == [
+            v.to_dict() for v in tracker._analyze_intermittent_violations_from_events(events)]
+        assert len(constant) == 1
+        assert len(intermittent) == 1
+
     def test_convert_to_algorithm_input_events(self):
         """Test conversion of PersistedBarkEvent to AlgorithmInputEvent objects."""
         tracker = LegalViolationTracker(interactive=False)